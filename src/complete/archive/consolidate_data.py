@@ -8,22 +8,44 @@ Merges:
 Computes:
 - Tier (top_premium, premium, standard)
 - Competitive position (Dominant, Strong, Competitive, Neutral, At Risk, Disadvantaged)
-- Days listed, improvements needed
+- Days listed, improvements needed (as a bitmask, see IMPROVEMENT_BITS)
 - Region from state
+- Dealer side table (dealer_id -> name/group/phone)
 
 Outputs:
 - output/reports/rv_data.json (for dashboard consumption)
 
+rv_data.json format (version 1.2):
+- listings[].improvement_mask replaces the old improvements message list.
+  Top-level improvement_bits maps each improvement name to its bit value
+  (bit i -> value 1 << i), so the needed improvements are
+  [name for name, bit in data['improvement_bits'].items() if mask & bit].
+  Their point values are in improvement_factors; calculate_improvements()
+  renders the old message strings for a raw listing.
+- listings[].dealer_name/dealer_group/dealer_phone moved to the top-level
+  dealers table: dealers[listing['dealer_id']] -> {name, group, phone}.
+  dealer_id is always a string ('' when the source listing has none).
+
 Usage:
     python src/complete/consolidate_data.py
     python src/complete/consolidate_data.py --input ranked_listings_20260119.json
 """
 
 import json
+import mmap
+import os
+import re
+import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
+from functools import lru_cache
+
+try:
+    import orjson  # Optional: much faster JSON parsing/writing for large extractions
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # CONFIGURATION
@@ -44,6 +66,10 @@ THOR_BRANDS = {
     'dutchmen': 'Dutchmen RV',
 }
 
+# All brand patterns in one alternation, matched anywhere in the make
+# (e.g. "Coleman By Dutchmen", "Keystone/Dutchmen")
+THOR_BRAND_RE = re.compile('|'.join(re.escape(pattern) for pattern in sorted(THOR_BRANDS, key=len, reverse=True)))
+
 # State to region mapping
 STATE_REGIONS = {
     # Midwest
@@ -69,10 +95,30 @@ STATE_REGIONS = {
     'ID': 'Mountain',
 }
 
+# API flag values that mean "set" (string "1", boolean or int)
+TRUTHY = frozenset(('1', True, 1))
+
 CURRENT_MODEL_YEAR = 2026
 YEAR_PENALTY_POINTS = 24
 RELEVANCE_PER_RANK = 15.0
 
+# Competitive position by (tier, years old); age is bucketed as 0, 1, 2+
+POSITION_TABLE = {
+    ('top_premium', 0): 'Dominant',
+    ('top_premium', 1): 'Strong',
+    ('top_premium', 2): 'Competitive',
+    ('premium', 0): 'Strong',
+    ('premium', 1): 'Neutral',
+    ('premium', 2): 'At Risk',
+    ('standard', 0): 'Competitive',
+    ('standard', 1): 'At Risk',
+    ('standard', 2): 'Disadvantaged',
+}
+
+# Per-listing tuple shapes: (views, saves) and get_quality_flags() output
+Engagement = Tuple[Optional[int], Optional[int]]
+QualityFlags = Tuple[Any, bool, bool, Any, int]
+
 # Improvement factors (relevance points)
 IMPROVEMENT_FACTORS = {
     'price': 194,
@@ -82,12 +128,49 @@ IMPROVEMENT_FACTORS = {
     'length': 8,  # merch points
 }
 
+# Bit flags for a listing's improvement_mask (decoded by the dashboard)
+IMPROVEMENT_BITS = {
+    'price': 1,
+    'vin': 2,
+    'photos': 4,      # fewer than 35 photos
+    'floorplan': 8,
+    'length': 16,
+    'year': 32,       # model-year penalty below Top Premium
+}
+
 
 # =============================================================================
 # DATA LOADING
 # =============================================================================
 
-def load_ranked_listings(output_dir: Path, input_file: str = None) -> tuple[dict, Path]:
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    With orjson the file is memory-mapped and parsed in place, avoiding a
+    full bytes copy of large ranked_listings files. Empty files cannot be
+    mapped, so they are read normally and fail with the usual decode error.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(data: Any, path: str) -> None:
+    """Write indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_ranked_listings(output_dir: Path, input_file: Optional[str] = None) -> tuple[dict, Path]:
     """Load the most recent ranked_listings JSON file."""
     if input_file:
         path = output_dir / input_file
@@ -98,13 +181,12 @@ def load_ranked_listings(output_dir: Path, input_file: str = None) -> tuple[dict
         path = files[0]
 
     print(f"Loading ranked listings: {path.name}")
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = read_json(path)
 
     return data, path
 
 
-def load_engagement_data(output_dir: Path) -> Dict[str, Dict]:
+def load_engagement_data(output_dir: Path) -> Dict[str, Engagement]:
     """Load the most recent engagement stats JSON file."""
     files = sorted(output_dir.glob('engagement_stats_*.json'), reverse=True)
     if not files:
@@ -113,19 +195,14 @@ def load_engagement_data(output_dir: Path) -> Dict[str, Dict]:
 
     path = files[0]
     print(f"Loading engagement data: {path.name}")
+    data = read_json(path)
 
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    # Build lookup by listing ID
-    engagement = {}
-    for result in data.get('results', []):
-        listing_id = str(result.get('id', ''))
-        if listing_id:
-            engagement[listing_id] = {
-                'views': result.get('views'),
-                'saves': result.get('saves'),
-            }
+    # Build lookup by listing ID: id -> (views, saves)
+    engagement = {
+        str(result['id']): (result.get('views'), result.get('saves'))
+        for result in data.get('results', ())
+        if result.get('id')
+    }
 
     print(f"  Loaded engagement for {len(engagement)} listings")
     return engagement
@@ -135,15 +212,17 @@ def load_engagement_data(output_dir: Path) -> Dict[str, Dict]:
 # CALCULATIONS
 # =============================================================================
 
+@lru_cache(maxsize=512)
 def identify_thor_brand(make: str) -> Optional[str]:
-    """Check if make belongs to Thor Industries family."""
+    """Check if make belongs to Thor Industries family.
+
+    Any brand pattern inside the make counts, the leftmost one winning.
+    Cached, since a run only sees a few dozen distinct makes.
+    """
     if not make:
         return None
-    make_lower = make.lower().strip()
-    for pattern, brand_name in THOR_BRANDS.items():
-        if pattern in make_lower:
-            return brand_name
-    return None
+    match = THOR_BRAND_RE.search(make.lower())
+    return THOR_BRANDS[match.group(0)] if match else None
 
 
 def get_tier(listing: dict) -> str:
@@ -152,112 +231,128 @@ def get_tier(listing: dict) -> str:
     is_prem = listing.get('is_premium')
 
     # Handle string "1" / "0" or boolean
-    if is_top in ('1', True, 1):
+    if is_top in TRUTHY:
         return 'top_premium'
-    elif is_prem in ('1', True, 1):
+    elif is_prem in TRUTHY:
         return 'premium'
     return 'standard'
 
 
-def get_competitive_position(tier: str, year: int) -> str:
+def get_competitive_position(tier: str, year: Optional[int]) -> str:
     """Calculate competitive position based on tier and model year."""
     if not year:
         return 'Unknown'
 
-    years_old = CURRENT_MODEL_YEAR - year
-
-    if tier == 'top_premium':
-        if years_old <= 0:
-            return 'Dominant'
-        elif years_old == 1:
-            return 'Strong'
-        else:
-            return 'Competitive'
-
-    if tier == 'premium':
-        if years_old <= 0:
-            return 'Strong'
-        elif years_old == 1:
-            return 'Neutral'
-        else:
-            return 'At Risk'
-
-    # Standard tier
-    if years_old <= 0:
-        return 'Competitive'
-    elif years_old == 1:
-        return 'At Risk'
-    return 'Disadvantaged'
+    years_old = min(max(CURRENT_MODEL_YEAR - year, 0), 2)
+    return POSITION_TABLE[(tier, years_old)]
 
 
-def calculate_days_listed(create_date: str) -> Optional[int]:
+def calculate_days_listed(create_date: Optional[str], today: Optional[date] = None) -> Optional[int]:
     """Calculate days since listing was created."""
     if not create_date:
         return None
     try:
-        for fmt in ['%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d']:
-            try:
-                created = datetime.strptime(create_date[:19].replace('Z', ''), fmt.replace('Z', ''))
-                return (datetime.now() - created).days
-            except ValueError:
-                continue
-        return None
-    except Exception:
+        return ((today or date.today()) - date.fromisoformat(create_date[:10])).days
+    except (TypeError, ValueError):
         return None
 
 
 def calculate_tier_ceilings(listings: List[dict]) -> Dict[str, int]:
     """Calculate best achievable rank for each tier."""
-    top_premium_ranks = [l['rank'] for l in listings
-                         if l.get('is_top_premium') in ('1', True, 1) and l.get('rank')]
-    premium_ranks = [l['rank'] for l in listings
-                    if l.get('is_premium') in ('1', True, 1) and l.get('rank')]
+    top_premium_max = premium_max = 0
+    for l in listings:
+        rank = l.get('rank')
+        if not rank:
+            continue
+        if l.get('is_top_premium') in TRUTHY and rank > top_premium_max:
+            top_premium_max = rank
+        if l.get('is_premium') in TRUTHY and rank > premium_max:
+            premium_max = rank
 
     return {
         'top_premium': 1,
-        'premium': max(top_premium_ranks) + 1 if top_premium_ranks else 1,
-        'standard': max(premium_ranks) + 1 if premium_ranks else 1,
+        'premium': top_premium_max + 1,
+        'standard': premium_max + 1,
     }
 
 
-def calculate_improvements(listing: dict) -> List[str]:
-    """Get list of improvement actions needed."""
-    actions = []
+def get_quality_flags(listing: dict) -> QualityFlags:
+    """Return (has_price, has_vin, has_floorplan, has_length, photo_count)."""
+    price = listing.get('price')
+    length = listing.get('length')
+    return (
+        price and float(price) > 0,
+        bool(listing.get('vin')),
+        bool(listing.get('floorplan_id')),
+        length and float(length) > 0,
+        int(listing.get('photo_count') or 0),
+    )
+
 
-    # Basic checks
-    has_price = listing.get('price') and float(listing.get('price') or 0) > 0
-    has_vin = bool(listing.get('vin'))
-    has_floorplan = bool(listing.get('floorplan_id'))
-    has_length = listing.get('length') and float(listing.get('length') or 0) > 0
-    photo_count = int(listing.get('photo_count') or 0)
+def calculate_improvement_mask(listing: dict, quality_flags: Optional[QualityFlags] = None,
+                               tier: Optional[str] = None) -> int:
+    """Get improvement actions needed as an IMPROVEMENT_BITS bitmask."""
+    has_price, has_vin, has_floorplan, has_length, photo_count = (
+        quality_flags or get_quality_flags(listing))
 
+    mask = 0
     if not has_price:
-        actions.append(f'Add price (+{IMPROVEMENT_FACTORS["price"]} rel)')
+        mask |= IMPROVEMENT_BITS['price']
     if not has_vin:
-        actions.append(f'Add VIN (+{IMPROVEMENT_FACTORS["vin"]} rel)')
+        mask |= IMPROVEMENT_BITS['vin']
     if photo_count < 35:
-        actions.append(f'Add {35 - photo_count} photos (+{IMPROVEMENT_FACTORS["photos_35"]} rel)')
+        mask |= IMPROVEMENT_BITS['photos']
     if not has_floorplan:
-        actions.append(f'Add floorplan (+{IMPROVEMENT_FACTORS["floorplan"]} rel)')
+        mask |= IMPROVEMENT_BITS['floorplan']
     if not has_length:
-        actions.append(f'Add length (+{IMPROVEMENT_FACTORS["length"]} merch)')
+        mask |= IMPROVEMENT_BITS['length']
 
-    # Year-aware recommendations
+    # Year penalty applies to anything below Top Premium
     year = listing.get('year')
-    if year:
-        years_old = CURRENT_MODEL_YEAR - year
-        tier = get_tier(listing)
+    if year and CURRENT_MODEL_YEAR - year >= 1 and (tier or get_tier(listing)) != 'top_premium':
+        mask |= IMPROVEMENT_BITS['year']
+
+    return mask
 
-        if years_old >= 1 and tier != 'top_premium':
-            penalty = years_old * YEAR_PENALTY_POINTS
-            if tier == 'standard':
-                actions.append(f'Year penalty: -{penalty} pts. Upgrade to Premium')
-            else:
-                actions.append(f'Year penalty: -{penalty} pts. Consider Top Premium')
+
+def calculate_improvements(listing: dict, quality_flags: Optional[QualityFlags] = None) -> List[str]:
+    """Get list of improvement actions needed, as display text.
+
+    Consolidated listings only carry ``improvement_mask``; use this to render
+    the messages on demand.
+    """
+    quality_flags = quality_flags or get_quality_flags(listing)
+    mask = calculate_improvement_mask(listing, quality_flags)
+    photo_count = quality_flags[4]
+    actions = []
+
+    if mask & IMPROVEMENT_BITS['price']:
+        actions.append(f'Add price (+{IMPROVEMENT_FACTORS["price"]} rel)')
+    if mask & IMPROVEMENT_BITS['vin']:
+        actions.append(f'Add VIN (+{IMPROVEMENT_FACTORS["vin"]} rel)')
+    if mask & IMPROVEMENT_BITS['photos']:
+        actions.append(f'Add {35 - photo_count} photos (+{IMPROVEMENT_FACTORS["photos_35"]} rel)')
+    if mask & IMPROVEMENT_BITS['floorplan']:
+        actions.append(f'Add floorplan (+{IMPROVEMENT_FACTORS["floorplan"]} rel)')
+    if mask & IMPROVEMENT_BITS['length']:
+        actions.append(f'Add length (+{IMPROVEMENT_FACTORS["length"]} merch)')
+
+    # Year-aware recommendations
+    if mask & IMPROVEMENT_BITS['year']:
+        penalty = (CURRENT_MODEL_YEAR - listing['year']) * YEAR_PENALTY_POINTS
+        if get_tier(listing) == 'standard':
+            actions.append(f'Year penalty: -{penalty} pts. Upgrade to Premium')
+        else:
+            actions.append(f'Year penalty: -{penalty} pts. Consider Top Premium')
 
     return actions
 
 
+def intern_str(value: Any) -> Any:
+    """Intern low-cardinality strings so repeated values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def get_image_url(listing: dict) -> str:
     """Construct CDN image URL for listing."""
     listing_id = listing.get('id', '')
@@ -266,36 +361,29 @@ def get_image_url(listing: dict) -> str:
     return ""
 
 
-def get_region(state: str) -> str:
-    """Get region from state code."""
-    return STATE_REGIONS.get(state, 'Unknown')
-
-
 # =============================================================================
 # CONSOLIDATION
 # =============================================================================
 
-def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceilings: Dict[str, int]) -> dict:
+def consolidate_listing(listing: dict, engagement: Dict[str, Engagement], tier_ceilings: Dict[str, int],
+                        today: Optional[date] = None) -> dict:
     """Consolidate a single listing with all computed fields."""
     listing_id = str(listing.get('id', ''))
-    eng = engagement.get(listing_id, {})
+    views, saves = engagement.get(listing_id, (None, None))
 
     tier = get_tier(listing)
     year = listing.get('year')
-    state = listing.get('state', '')
+    state = intern_str(listing.get('state', ''))
 
-    # Quality indicators
-    has_price = listing.get('price') and float(listing.get('price') or 0) > 0
-    has_vin = bool(listing.get('vin'))
-    has_floorplan = bool(listing.get('floorplan_id'))
-    has_length = listing.get('length') and float(listing.get('length') or 0) > 0
-    photo_count = int(listing.get('photo_count') or 0)
+    # Quality indicators (shared with calculate_improvements)
+    quality_flags = get_quality_flags(listing)
+    has_price, has_vin, has_floorplan, has_length, photo_count = quality_flags
 
     # Thor brand identification
     thor_brand = identify_thor_brand(listing.get('make', ''))
 
-    # Improvements
-    improvements = calculate_improvements(listing)
+    # Improvements (bitmask; text is rendered on demand)
+    improvement_mask = calculate_improvement_mask(listing, quality_flags, tier)
 
     return {
         # Identifiers
@@ -306,13 +394,13 @@ def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceiling
 
         # Vehicle info
         'year': year,
-        'make': listing.get('make', ''),
+        'make': intern_str(listing.get('make', '')),
         'model': listing.get('model', ''),
         'trim': listing.get('trim', ''),
         'vin': listing.get('vin', ''),  # Actual VIN value
         'stock_number': listing.get('stock_number', ''),
-        'class': listing.get('class', ''),
-        'condition': listing.get('condition', ''),
+        'class': intern_str(listing.get('class', '')),
+        'condition': intern_str(listing.get('condition', '')),
         'length': listing.get('length'),
         'mileage': listing.get('mileage'),
 
@@ -321,21 +409,19 @@ def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceiling
         'msrp': listing.get('msrp'),
 
         # Location (dealer location)
-        'city': listing.get('city', ''),
+        'city': intern_str(listing.get('city', '')),
         'state': state,
         'zip_code': listing.get('zip_code', ''),
-        'region': get_region(state),
+        'region': STATE_REGIONS.get(state, 'Unknown'),
 
         # Search context (query parameters)
         'search_zip': listing.get('search_zip', ''),
-        'search_type': listing.get('search_type', ''),
+        'search_type': intern_str(listing.get('search_type', '')),
         'search_radius': listing.get('search_radius', 50),
 
-        # Dealer
-        'dealer_name': listing.get('dealer_name', ''),
-        'dealer_id': listing.get('dealer_id', ''),
-        'dealer_group': listing.get('dealer_group', ''),
-        'dealer_phone': listing.get('dealer_phone', ''),
+        # Dealer (name/group/phone live in the top-level dealers table,
+        # keyed by the same string id)
+        'dealer_id': str(listing.get('dealer_id') or ''),
 
         # Scoring
         'relevance_score': listing.get('relevance_score'),
@@ -344,8 +430,8 @@ def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceiling
         # Tier analysis
         'tier': tier,
         'tier_ceiling': tier_ceilings.get(tier, 1),
-        'is_premium': listing.get('is_premium') in ('1', True, 1),
-        'is_top_premium': listing.get('is_top_premium') in ('1', True, 1),
+        'is_premium': listing.get('is_premium') in TRUTHY,
+        'is_top_premium': listing.get('is_top_premium') in TRUTHY,
 
         # Competitive position
         'position': get_competitive_position(tier, year),
@@ -358,11 +444,11 @@ def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceiling
         'has_length': has_length,
 
         # Engagement
-        'views': eng.get('views'),
-        'saves': eng.get('saves'),
+        'views': views,
+        'saves': saves,
 
         # Age
-        'days_listed': calculate_days_listed(listing.get('create_date')),
+        'days_listed': calculate_days_listed(listing.get('create_date'), today),
         'create_date': listing.get('create_date', ''),
         'price_drop_date': listing.get('price_drop_date', ''),
 
@@ -371,27 +457,43 @@ def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceiling
         'thor_brand': thor_brand,
 
         # Improvements
-        'improvements': improvements,
-        'improvement_count': len(improvements),
+        'improvement_mask': improvement_mask,
+        'improvement_count': bin(improvement_mask).count('1'),
     }
 
 
+def build_dealer_table(listings: List[dict]) -> Dict[str, dict]:
+    """Build a dealer_id -> {name, group, phone} side table (first listing wins)."""
+    dealers = {}
+    for listing in listings:
+        dealer_id = str(listing.get('dealer_id') or '')
+        if dealer_id not in dealers:
+            dealers[dealer_id] = {
+                'name': intern_str(listing.get('dealer_name', '')),
+                'group': intern_str(listing.get('dealer_group', '')),
+                'phone': listing.get('dealer_phone', ''),
+            }
+    return dealers
+
+
 def build_summary(listings: List[dict]) -> dict:
-    """Build summary statistics from consolidated listings."""
+    """Build summary statistics from consolidated listings (single pass)."""
     total = len(listings)
-    thor_listings = [l for l in listings if l.get('is_thor')]
-    thor_count = len(thor_listings)
-
-    # Tier breakdown
-    by_tier = {
-        'top_premium': len([l for l in listings if l.get('tier') == 'top_premium']),
-        'premium': len([l for l in listings if l.get('tier') == 'premium']),
-        'standard': len([l for l in listings if l.get('tier') == 'standard']),
-    }
+    thor_count = 0
+
+    by_tier = Counter()
+    by_year = Counter()
+    by_brand = Counter()      # Thor only
+    by_position = Counter()   # Thor only
+    by_region = Counter()
+    views_count = views_total = 0
+    saves_count = saves_total = 0
 
-    # Year breakdown
-    by_year = defaultdict(int)
     for l in listings:
+        by_tier[l.get('tier')] += 1
+        by_region[l.get('region', 'Unknown')] += 1
+
+        # Year breakdown
         year = l.get('year')
         if year == CURRENT_MODEL_YEAR:
             by_year['current'] += 1
@@ -402,48 +504,42 @@ def build_summary(listings: List[dict]) -> dict:
         else:
             by_year['unknown'] += 1
 
-    # Brand breakdown (Thor only)
-    by_brand = defaultdict(int)
-    for l in thor_listings:
-        brand = l.get('thor_brand', 'Unknown')
-        by_brand[brand] += 1
-
-    # Position breakdown (Thor only)
-    by_position = defaultdict(int)
-    for l in thor_listings:
-        pos = l.get('position', 'Unknown')
-        by_position[pos] += 1
-
-    # Region breakdown
-    by_region = defaultdict(int)
-    for l in listings:
-        region = l.get('region', 'Unknown')
-        by_region[region] += 1
-
-    # Engagement stats
-    views_list = [l['views'] for l in listings if l.get('views') is not None]
-    saves_list = [l['saves'] for l in listings if l.get('saves') is not None]
+        # Brand / position breakdown (Thor only)
+        if l.get('is_thor'):
+            thor_count += 1
+            by_brand[l.get('thor_brand', 'Unknown')] += 1
+            by_position[l.get('position', 'Unknown')] += 1
+
+        # Engagement stats
+        views = l.get('views')
+        if views is not None:
+            views_count += 1
+            views_total += views
+        saves = l.get('saves')
+        if saves is not None:
+            saves_count += 1
+            saves_total += saves
 
     return {
         'total_listings': total,
         'thor_count': thor_count,
         'thor_pct': round(thor_count / total * 100, 1) if total > 0 else 0,
-        'by_tier': dict(by_tier),
+        'by_tier': {tier: by_tier[tier] for tier in ('top_premium', 'premium', 'standard')},
         'by_year': dict(by_year),
         'by_brand': dict(by_brand),
         'by_position': dict(by_position),
         'by_region': dict(by_region),
         'engagement': {
-            'listings_with_views': len(views_list),
-            'total_views': sum(views_list) if views_list else 0,
-            'avg_views': round(sum(views_list) / len(views_list), 1) if views_list else 0,
-            'total_saves': sum(saves_list) if saves_list else 0,
-            'avg_saves': round(sum(saves_list) / len(saves_list), 1) if saves_list else 0,
+            'listings_with_views': views_count,
+            'total_views': views_total,
+            'avg_views': round(views_total / views_count, 1) if views_count else 0,
+            'total_saves': saves_total,
+            'avg_saves': round(saves_total / saves_count, 1) if saves_count else 0,
         },
     }
 
 
-def consolidate(output_dir: Path, input_file: str = None) -> dict:
+def consolidate(output_dir: Path, input_file: Optional[str] = None) -> dict:
     """Main consolidation function."""
     # Load data
     ranked_data, ranked_path = load_ranked_listings(output_dir, input_file)
@@ -456,10 +552,9 @@ def consolidate(output_dir: Path, input_file: str = None) -> dict:
     tier_ceilings = calculate_tier_ceilings(listings)
     print(f"  Tier ceilings: {tier_ceilings}")
 
-    # Consolidate each listing
-    consolidated = []
-    for listing in listings:
-        consolidated.append(consolidate_listing(listing, engagement, tier_ceilings))
+    # Consolidate each listing (single comprehension pass, no per-row append)
+    today = date.today()
+    consolidated = [consolidate_listing(listing, engagement, tier_ceilings, today) for listing in listings]
 
     # Extract search context from first listing
     first = listings[0] if listings else {}
@@ -470,6 +565,10 @@ def consolidate(output_dir: Path, input_file: str = None) -> dict:
         'condition': first.get('search_condition', 'N'),
     }
 
+    # Dealer details are stored once per dealer, not per listing
+    dealers = build_dealer_table(listings)
+    print(f"  Dealers: {len(dealers)}")
+
     # Build summary
     summary = build_summary(consolidated)
 
@@ -479,11 +578,14 @@ def consolidate(output_dir: Path, input_file: str = None) -> dict:
             'generated_at': datetime.now().isoformat(),
             'source_ranked': ranked_path.name,
             'source_engagement': 'engagement_stats_*.json (latest)',
-            'version': '1.0',
+            'version': '1.2',
         },
         'search_context': search_context,
         'tier_ceilings': tier_ceilings,
+        'improvement_bits': IMPROVEMENT_BITS,
+        'improvement_factors': IMPROVEMENT_FACTORS,
         'summary': summary,
+        'dealers': dealers,
         'listings': consolidated,
     }
 
@@ -515,8 +617,7 @@ def main():
 
     # Save
     output_path = args.output or str(reports_dir / 'rv_data.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json(data, output_path)
 
     print("=" * 60)
     print(f"Consolidated data saved: {output_path}")
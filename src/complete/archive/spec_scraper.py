@@ -6,6 +6,7 @@ Usage:
     python src/complete/spec_scraper.py                    # All Thor listings
     python src/complete/spec_scraper.py --limit 10         # Limit to 10 listings
     python src/complete/spec_scraper.py --thor-only        # Only Thor brands (default)
+    python src/complete/spec_scraper.py --concurrency 3    # Parallel browser pages (default 2)
 """
 
 import json
@@ -29,6 +30,16 @@ SPEC_FIELDS = [
     'cargoWeight', 'dryWeight', 'width', 'height'
 ]
 
+# Keys that identify the adDetails object inside the Nuxt payload
+SPEC_TRIGGER_FIELDS = frozenset(('sleepingCapacity', 'slideouts', 'grossVehicleWeight'))
+
+# Parallel browser pages (each still waits 0.5s between its own requests).
+# Kept low: the site is rate limited and DataDome-protected.
+MAX_CONCURRENT_PAGES = 2
+
+# Embedded Nuxt payload on listing detail pages
+NUXT_DATA_RE = re.compile(r'<script[^>]*id="__NUXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
 
 def is_thor_brand(make: str) -> bool:
     """Check if make is a Thor brand."""
@@ -38,35 +49,52 @@ def is_thor_brand(make: str) -> bool:
     return any(brand in make_lower for brand in THOR_BRANDS)
 
 
-def resolve_nuxt_data(data: list, val, depth: int = 0):
-    """Recursively resolve Nuxt's reference-based data format."""
+def resolve_nuxt_data(data: list, val, depth: int = 0, cache: dict = None):
+    """Recursively resolve Nuxt's reference-based data format.
+
+    Nuxt payloads share subtrees heavily, so resolved indices are memoized
+    in ``cache`` (one dict per payload). Entries are keyed by index and depth
+    because subtrees reached near the depth limit are only partly resolved.
+    """
     if depth > 25:
         return val
+    if cache is None:
+        cache = {}
     if isinstance(val, int) and 0 <= val < len(data):
-        return resolve_nuxt_data(data, data[val], depth + 1)
+        key = (val, depth)
+        if key in cache:
+            return cache[key]
+        resolved = resolve_nuxt_data(data, data[val], depth + 1, cache)
+        cache[key] = resolved
+        return resolved
     if isinstance(val, list):
-        return [resolve_nuxt_data(data, v, depth + 1) for v in val]
+        return [resolve_nuxt_data(data, v, depth + 1, cache) for v in val]
     if isinstance(val, dict):
-        return {k: resolve_nuxt_data(data, v, depth + 1) for k, v in val.items()}
+        return {k: resolve_nuxt_data(data, v, depth + 1, cache) for k, v in val.items()}
     return val
 
 
 def extract_specs_from_nuxt(nuxt_data: list) -> dict:
     """Extract specs from NUXT data."""
     specs = {}
+    cache = {}
 
     for item in nuxt_data:
         if not isinstance(item, dict):
             continue
 
         # Look for the adDetails object with specs
-        if 'sleepingCapacity' in item or 'slideouts' in item or 'grossVehicleWeight' in item:
-            resolved = resolve_nuxt_data(nuxt_data, item)
-            for field in SPEC_FIELDS:
-                val = resolved.get(field)
-                if val is not None and val != '' and str(val) != 'null':
-                    specs[field] = val
-            break
+        if SPEC_TRIGGER_FIELDS.isdisjoint(item):
+            continue
+
+        # Resolve only the spec fields, not the whole adDetails subtree
+        for field in SPEC_FIELDS:
+            if field not in item:
+                continue
+            val = resolve_nuxt_data(nuxt_data, item[field], 1, cache)
+            if val is not None and val != '' and str(val) != 'null':
+                specs[field] = val
+        break
 
     return specs
 
@@ -99,7 +127,7 @@ async def scrape_listing(page, listing: dict) -> dict:
             return result
 
         # Extract NUXT_DATA
-        match = re.search(r'<script[^>]*id="__NUXT_DATA__"[^>]*>(.*?)</script>', content, re.DOTALL)
+        match = NUXT_DATA_RE.search(content)
         if not match:
             result['error'] = 'no_nuxt_data'
             return result
@@ -121,10 +149,13 @@ async def main():
     # Parse arguments
     limit = None
     thor_only = True
+    concurrency = MAX_CONCURRENT_PAGES
 
     for i, arg in enumerate(sys.argv):
         if arg == '--limit' and i + 1 < len(sys.argv):
             limit = int(sys.argv[i + 1])
+        if arg == '--concurrency' and i + 1 < len(sys.argv):
+            concurrency = max(1, int(sys.argv[i + 1]))
         if arg == '--all':
             thor_only = False
 
@@ -152,30 +183,46 @@ async def main():
     if limit:
         listings = listings[:limit]
 
-    print(f"Scraping {len(listings)} listings...")
+    print(f"Scraping {len(listings)} listings ({concurrency} concurrent pages)...")
     print("-" * 60)
 
-    results = []
-
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         context = await browser.new_context(
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         )
-        page = await context.new_page()
-
-        for i, listing in enumerate(listings):
-            result = await scrape_listing(page, listing)
-            results.append(result)
-
-            # Progress
-            status = f"OK ({result['spec_count']} specs)" if result['success'] else f"FAIL:{result['error']}"
-            make = (listing.get('make') or '?')[:10]
-            model = (listing.get('model') or '?')[:15]
-            print(f"  [{i+1}/{len(listings)}] {make} {model}: {status}")
 
-            # Small delay
-            await asyncio.sleep(0.5)
+        # Open the pages once and hand them out to listings through a queue
+        pages = [await context.new_page() for _ in range(max(1, min(concurrency, len(listings))))]
+        page_pool = asyncio.Queue()
+        for page in pages:
+            page_pool.put_nowait(page)
+        done = 0
+
+        async def scrape_with_pool(listing: dict) -> dict:
+            nonlocal done
+            page = await page_pool.get()
+            try:
+                result = await scrape_listing(page, listing)
+
+                # Progress
+                done += 1
+                status = f"OK ({result['spec_count']} specs)" if result['success'] else f"FAIL:{result['error']}"
+                make = (listing.get('make') or '?')[:10]
+                model = (listing.get('model') or '?')[:15]
+                print(f"  [{done}/{len(listings)}] {make} {model}: {status}")
+
+                # Small per-page delay
+                await asyncio.sleep(0.5)
+                return result
+            finally:
+                page_pool.put_nowait(page)
+
+        try:
+            results = await asyncio.gather(*(scrape_with_pool(l) for l in listings))
+        finally:
+            for page in pages:
+                await page.close()
 
         await browser.close()
 
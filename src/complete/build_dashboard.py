@@ -14,14 +14,25 @@ Usage:
     python src/complete/build_dashboard.py
     python src/complete/build_dashboard.py --input ranked_listings_merged.json
     python src/complete/build_dashboard.py --keep-data  # Don't auto-clean old files
+    python src/complete/build_dashboard.py --gzip       # Also write rv_dashboard_standalone.html.gz
+    python src/complete/build_dashboard.py --pack-data  # Embed the data compressed (smaller file, inflated on load)
 """
 
+import base64
+import gzip
 import json
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from functools import lru_cache
+
+try:
+    import orjson  # Optional: much faster serialization of the embedded payload
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # CONFIGURATION
@@ -42,6 +53,12 @@ THOR_BRANDS = {
     'dutchmen': 'Dutchmen RV',
 }
 
+# All brand patterns in one alternation: a single scan of the make string.
+# Patterns are listed longest first, but the order does not change results:
+# every prefix ('thor', 'tiffin', 'entegra') maps to the same brand as its
+# longer form.
+THOR_BRAND_RE = re.compile('|'.join(re.escape(pattern) for pattern in sorted(THOR_BRANDS, key=len, reverse=True)))
+
 STATE_REGIONS = {
     'IL': 'Midwest', 'IN': 'Midwest', 'MI': 'Midwest', 'OH': 'Midwest',
     'WI': 'Midwest', 'MN': 'Midwest', 'IA': 'Midwest', 'MO': 'Midwest',
@@ -58,9 +75,32 @@ STATE_REGIONS = {
     'CO': 'Mountain', 'UT': 'Mountain', 'WY': 'Mountain', 'MT': 'Mountain', 'ID': 'Mountain',
 }
 
+# API flag values that mean "set" (string "1", boolean or int)
+TRUTHY = frozenset(('1', True, 1))
+
 CURRENT_MODEL_YEAR = 2026
+
+# Competitive position by (tier, years_old clamped to 0..2)
+POSITION_TABLE = {
+    ('top_premium', 0): 'Dominant',
+    ('top_premium', 1): 'Strong',
+    ('top_premium', 2): 'Competitive',
+    ('premium', 0): 'Strong',
+    ('premium', 1): 'Neutral',
+    ('premium', 2): 'At Risk',
+    ('standard', 0): 'Competitive',
+    ('standard', 1): 'At Risk',
+    ('standard', 2): 'Disadvantaged',
+}
+
 YEAR_PENALTY_POINTS = 24
 
+# Repetitive string fields embedded as a value table plus per-listing codes
+DICTIONARY_COLUMNS = frozenset((
+    'make', 'class', 'condition', 'city', 'state', 'region', 'search_zip', 'search_type',
+    'dealer_name', 'dealer_id', 'dealer_group', 'dealer_phone', 'tier', 'position', 'thor_brand',
+))
+
 IMPROVEMENT_FACTORS = {
     'price': 194,
     'vin': 165,
@@ -69,6 +109,13 @@ IMPROVEMENT_FACTORS = {
     'length': 8,
 }
 
+# Improvement action messages (factors are constant, so format once)
+ACTION_ADD_PRICE = f'Add price (+{IMPROVEMENT_FACTORS["price"]} rel)'
+ACTION_ADD_VIN = f'Add VIN (+{IMPROVEMENT_FACTORS["vin"]} rel)'
+ACTION_ADD_PHOTOS = 'Add {} photos (+' + str(IMPROVEMENT_FACTORS['photos_35']) + ' rel)'
+ACTION_ADD_FLOORPLAN = f'Add floorplan (+{IMPROVEMENT_FACTORS["floorplan"]} rel)'
+ACTION_ADD_LENGTH = f'Add length (+{IMPROVEMENT_FACTORS["length"]} merch)'
+
 # =============================================================================
 # DATA LOADING
 # =============================================================================
@@ -94,7 +141,7 @@ def load_ranked_listings(output_dir: Path, input_file: str = None) -> tuple:
     return data, path
 
 
-def load_engagement_data(output_dir: Path) -> Dict[str, Dict]:
+def load_engagement_data(output_dir: Path) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
     """Load the most recent engagement stats JSON file."""
     files = sorted(output_dir.glob('engagement_stats_*.json'), reverse=True)
     if not files:
@@ -107,14 +154,12 @@ def load_engagement_data(output_dir: Path) -> Dict[str, Dict]:
     with open(path, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
+    # Compact lookup: id -> (views, saves)
     engagement = {}
     for result in data.get('results', []):
         listing_id = str(result.get('id', ''))
         if listing_id:
-            engagement[listing_id] = {
-                'views': result.get('views'),
-                'saves': result.get('saves'),
-            }
+            engagement[listing_id] = (result.get('views'), result.get('saves'))
     return engagement
 
 
@@ -122,22 +167,18 @@ def load_engagement_data(output_dir: Path) -> Dict[str, Dict]:
 # CALCULATIONS
 # =============================================================================
 
+@lru_cache(maxsize=1024)
 def identify_thor_brand(make: str) -> Optional[str]:
     if not make:
         return None
-    make_lower = make.lower().strip()
-    for pattern, brand_name in THOR_BRANDS.items():
-        if pattern in make_lower:
-            return brand_name
-    return None
+    match = THOR_BRAND_RE.search(make.lower())
+    return THOR_BRANDS[match.group(0)] if match else None
 
 
 def get_tier(listing: dict) -> str:
-    is_top = listing.get('is_top_premium')
-    is_prem = listing.get('is_premium')
-    if is_top in ('1', True, 1):
+    if listing.get('is_top_premium') in TRUTHY:
         return 'top_premium'
-    elif is_prem in ('1', True, 1):
+    if listing.get('is_premium') in TRUTHY:
         return 'premium'
     return 'standard'
 
@@ -145,165 +186,159 @@ def get_tier(listing: dict) -> str:
 def get_competitive_position(tier: str, year: int) -> str:
     if not year:
         return 'Unknown'
-    years_old = CURRENT_MODEL_YEAR - year
-
-    if tier == 'top_premium':
-        if years_old <= 0:
-            return 'Dominant'
-        elif years_old == 1:
-            return 'Strong'
-        return 'Competitive'
-
-    if tier == 'premium':
-        if years_old <= 0:
-            return 'Strong'
-        elif years_old == 1:
-            return 'Neutral'
-        return 'At Risk'
-
-    if years_old <= 0:
-        return 'Competitive'
-    elif years_old == 1:
-        return 'At Risk'
-    return 'Disadvantaged'
-
-
-def calculate_days_listed(create_date: str) -> Optional[int]:
-    if not create_date:
-        return None
+    years_old = min(max(CURRENT_MODEL_YEAR - year, 0), 2)
+    return POSITION_TABLE[(tier, years_old)]
+
+
+@lru_cache(maxsize=8192)
+def parse_create_date(create_date: str) -> Optional[datetime]:
+    """Parse a listing create_date (cached; many listings share timestamps).
+
+    Accepts only '%Y-%m-%dT%H:%M:%S' and '%Y-%m-%d' (a trailing 'Z' is
+    dropped), always returning a naive datetime. fromisoformat is the fast
+    path, but it also takes forms like "2026-01-01 10:00" or "...T10:00Z",
+    so its result is used only when the text is in one of those two forms.
+    """
+    text = create_date[:19].replace('Z', '')
     try:
-        for fmt in ['%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d']:
-            try:
-                created = datetime.strptime(create_date[:19].replace('Z', ''), fmt.replace('Z', ''))
-                return (datetime.now() - created).days
-            except ValueError:
-                continue
+        created = datetime.fromisoformat(text)
+    except ValueError:
+        created = None
+    if created is not None and created.tzinfo is None and (
+            created.isoformat() == text or created.strftime('%Y-%m-%d') == text):
+        return created
+    for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%d']:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def calculate_days_listed(create_date: str, now: Optional[datetime] = None) -> Optional[int]:
+    if not create_date or not isinstance(create_date, str):
         return None
-    except Exception:
+    created = parse_create_date(create_date)
+    if created is None:
         return None
+    return ((now or datetime.now()) - created).days
 
 
 def calculate_tier_ceilings(listings: List[dict]) -> Dict[str, int]:
-    top_premium_ranks = [l['rank'] for l in listings
-                         if l.get('is_top_premium') in ('1', True, 1) and l.get('rank')]
-    premium_ranks = [l['rank'] for l in listings
-                    if l.get('is_premium') in ('1', True, 1) and l.get('rank')]
+    top_premium_max = premium_max = 0
+    for l in listings:
+        rank = l.get('rank')
+        if not rank:
+            continue
+        if l.get('is_top_premium') in TRUTHY and rank > top_premium_max:
+            top_premium_max = rank
+        if l.get('is_premium') in TRUTHY and rank > premium_max:
+            premium_max = rank
     return {
         'top_premium': 1,
-        'premium': max(top_premium_ranks) + 1 if top_premium_ranks else 1,
-        'standard': max(premium_ranks) + 1 if premium_ranks else 1,
+        'premium': top_premium_max + 1,
+        'standard': premium_max + 1,
     }
 
 
-def calculate_improvements(listing: dict) -> List[str]:
+def calculate_improvements(*, has_price: bool, has_vin: bool, has_floorplan: bool, has_length: bool,
+                           photo_count: int, tier: str, years_old: Optional[int]) -> List[str]:
     actions = []
-    has_price = listing.get('price') and float(listing.get('price') or 0) > 0
-    has_vin = bool(listing.get('vin'))
-    has_floorplan = bool(listing.get('floorplan_id'))
-    has_length = listing.get('length') and float(listing.get('length') or 0) > 0
-    photo_count = int(listing.get('photo_count') or 0)
-
     if not has_price:
-        actions.append(f'Add price (+{IMPROVEMENT_FACTORS["price"]} rel)')
+        actions.append(ACTION_ADD_PRICE)
     if not has_vin:
-        actions.append(f'Add VIN (+{IMPROVEMENT_FACTORS["vin"]} rel)')
+        actions.append(ACTION_ADD_VIN)
     if photo_count < 35:
-        actions.append(f'Add {35 - photo_count} photos (+{IMPROVEMENT_FACTORS["photos_35"]} rel)')
+        actions.append(ACTION_ADD_PHOTOS.format(35 - photo_count))
     if not has_floorplan:
-        actions.append(f'Add floorplan (+{IMPROVEMENT_FACTORS["floorplan"]} rel)')
+        actions.append(ACTION_ADD_FLOORPLAN)
     if not has_length:
-        actions.append(f'Add length (+{IMPROVEMENT_FACTORS["length"]} merch)')
-
-    year = listing.get('year')
-    if year:
-        years_old = CURRENT_MODEL_YEAR - year
-        tier = get_tier(listing)
-        if years_old >= 1 and tier != 'top_premium':
-            penalty = years_old * YEAR_PENALTY_POINTS
-            if tier == 'standard':
-                actions.append(f'Year penalty: -{penalty} pts. Upgrade to Premium')
-            else:
-                actions.append(f'Year penalty: -{penalty} pts. Consider Top Premium')
-
-    return actions
-
-
-def get_image_url(listing: dict) -> str:
-    listing_id = listing.get('id', '')
-    if listing_id:
-        return f"https://cdn-p.tradercdn.com/images/rvtrader/{listing_id}/0.jpg"
-    return ""
+        actions.append(ACTION_ADD_LENGTH)
 
+    if years_old is not None and years_old >= 1 and tier != 'top_premium':
+        penalty = years_old * YEAR_PENALTY_POINTS
+        if tier == 'standard':
+            actions.append(f'Year penalty: -{penalty} pts. Upgrade to Premium')
+        else:
+            actions.append(f'Year penalty: -{penalty} pts. Consider Top Premium')
 
-def get_region(state: str) -> str:
-    return STATE_REGIONS.get(state, 'Unknown')
+    return actions
 
 
 # =============================================================================
 # CONSOLIDATION
 # =============================================================================
 
-def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceilings: Dict[str, int]) -> dict:
-    listing_id = str(listing.get('id', ''))
-    eng = engagement.get(listing_id, {})
+def consolidate_listing(listing: dict, engagement: Dict[str, tuple], tier_ceilings: Dict[str, int],
+                        now: Optional[datetime] = None) -> dict:
+    get = listing.get
+    listing_id = str(get('id', ''))
+    views, saves = engagement.get(listing_id, (None, None))
     tier = get_tier(listing)
-    year = listing.get('year')
-    state = listing.get('state', '')
-
-    has_price = listing.get('price') and float(listing.get('price') or 0) > 0
-    has_vin = bool(listing.get('vin'))
-    has_floorplan = bool(listing.get('floorplan_id'))
-    has_length = listing.get('length') and float(listing.get('length') or 0) > 0
-    photo_count = int(listing.get('photo_count') or 0)
-
-    thor_brand = identify_thor_brand(listing.get('make', ''))
-    improvements = calculate_improvements(listing)
+    year = get('year')
+    state = get('state', '')
+
+    price = get('price')
+    length = get('length')
+    has_price = price and float(price) > 0
+    has_vin = bool(get('vin'))
+    has_floorplan = bool(get('floorplan_id'))
+    has_length = length and float(length) > 0
+    photo_count = int(get('photo_count') or 0)
+    price_drop_date = get('price_drop_date', '')
+    price_dropped = parse_create_date(price_drop_date) if price_drop_date and isinstance(price_drop_date, str) else None
+
+    thor_brand = identify_thor_brand(get('make', ''))
+    improvements = calculate_improvements(
+        has_price=bool(has_price), has_vin=has_vin, has_floorplan=has_floorplan, has_length=bool(has_length),
+        photo_count=photo_count, tier=tier, years_old=CURRENT_MODEL_YEAR - year if year else None)
 
     return {
         'id': listing_id,
-        'rank': listing.get('rank'),
-        'listing_url': listing.get('listing_url', ''),
-        'image_url': get_image_url(listing),
+        'rank': get('rank'),
+        'listing_url': get('listing_url', ''),
+        'image_url': f"https://cdn-p.tradercdn.com/images/rvtrader/{listing_id}/0.jpg" if get('id') else '',
         'year': year,
-        'make': listing.get('make', ''),
-        'model': listing.get('model', ''),
-        'trim': listing.get('trim', ''),
-        'vin': listing.get('vin', ''),
-        'stock_number': listing.get('stock_number', ''),
-        'class': listing.get('class', ''),
-        'condition': listing.get('condition', ''),
-        'length': listing.get('length'),
-        'mileage': listing.get('mileage'),
-        'price': listing.get('price'),
-        'msrp': listing.get('msrp'),
-        'city': listing.get('city', ''),
+        'make': get('make', ''),
+        'model': get('model', ''),
+        'trim': get('trim', ''),
+        'vin': get('vin', ''),
+        'stock_number': get('stock_number', ''),
+        'class': get('class', ''),
+        'condition': get('condition', ''),
+        'length': length,
+        'mileage': get('mileage'),
+        'price': price,
+        'msrp': get('msrp'),
+        'city': get('city', ''),
         'state': state,
-        'zip_code': listing.get('zip_code', ''),
-        'region': get_region(state),
-        'search_zip': listing.get('search_zip', ''),
-        'search_type': listing.get('search_type', ''),
-        'search_radius': listing.get('search_radius', 50),
-        'dealer_name': listing.get('dealer_name', ''),
-        'dealer_id': listing.get('dealer_id', ''),
-        'dealer_group': listing.get('dealer_group', ''),
-        'dealer_phone': listing.get('dealer_phone', ''),
-        'relevance_score': listing.get('relevance_score'),
-        'merch_score': listing.get('merch_score'),
+        'zip_code': get('zip_code', ''),
+        'region': STATE_REGIONS.get(state, 'Unknown'),
+        'search_zip': get('search_zip', ''),
+        'search_type': get('search_type', ''),
+        'search_radius': get('search_radius', 50),
+        'dealer_name': get('dealer_name', ''),
+        'dealer_id': get('dealer_id', ''),
+        'dealer_group': get('dealer_group', ''),
+        'dealer_phone': get('dealer_phone', ''),
+        'relevance_score': get('relevance_score'),
+        'merch_score': get('merch_score'),
         'tier': tier,
         'tier_ceiling': tier_ceilings.get(tier, 1),
-        'is_premium': listing.get('is_premium') in ('1', True, 1),
-        'is_top_premium': listing.get('is_top_premium') in ('1', True, 1),
+        'is_premium': get('is_premium') in TRUTHY,
+        'is_top_premium': get('is_top_premium') in TRUTHY,
         'position': get_competitive_position(tier, year),
         'photo_count': photo_count,
         'has_vin': has_vin,
         'has_floorplan': has_floorplan,
         'has_price': has_price,
         'has_length': has_length,
-        'views': eng.get('views'),
-        'saves': eng.get('saves'),
-        'days_listed': calculate_days_listed(listing.get('create_date')),
-        'create_date': listing.get('create_date', ''),
-        'price_drop_date': listing.get('price_drop_date', ''),
+        'views': views,
+        'saves': saves,
+        'days_listed': calculate_days_listed(get('create_date'), now),
+        'create_date': get('create_date', ''),
+        'price_drop_date': price_drop_date,
+        'price_drop_day': price_dropped.date().isoformat() if price_dropped else '',
         'is_thor': bool(thor_brand),
         'thor_brand': thor_brand,
         'improvements': improvements,
@@ -313,60 +348,65 @@ def consolidate_listing(listing: dict, engagement: Dict[str, Dict], tier_ceiling
 
 def build_summary(listings: List[dict]) -> dict:
     total = len(listings)
-    thor_listings = [l for l in listings if l.get('is_thor')]
-    thor_count = len(thor_listings)
-
-    by_tier = {
-        'top_premium': len([l for l in listings if l.get('tier') == 'top_premium']),
-        'premium': len([l for l in listings if l.get('tier') == 'premium']),
-        'standard': len([l for l in listings if l.get('tier') == 'standard']),
-    }
-
-    by_year = defaultdict(int)
+    thor_count = 0
+    by_tier = {'top_premium': 0, 'premium': 0, 'standard': 0}
+    by_year = Counter()
+    by_brand = Counter()
+    by_position = Counter()
+    by_region = Counter()
+    views_count = views_total = 0
+    saves_count = saves_total = 0
+    current_year = CURRENT_MODEL_YEAR
+    last_year = current_year - 1
+
+    # Single pass over listings for every breakdown
     for l in listings:
-        year = l.get('year')
-        if year == CURRENT_MODEL_YEAR:
+        get = l.get
+        tier = get('tier')
+        if tier in by_tier:
+            by_tier[tier] += 1
+
+        year = get('year')
+        if year == current_year:
             by_year['current'] += 1
-        elif year == CURRENT_MODEL_YEAR - 1:
+        elif year == last_year:
             by_year['one_year_old'] += 1
         elif year:
             by_year['older'] += 1
         else:
             by_year['unknown'] += 1
 
-    by_brand = defaultdict(int)
-    for l in thor_listings:
-        brand = l.get('thor_brand', 'Unknown')
-        by_brand[brand] += 1
+        if get('is_thor'):
+            thor_count += 1
+            by_brand[get('thor_brand', 'Unknown')] += 1
+            by_position[get('position', 'Unknown')] += 1
 
-    by_position = defaultdict(int)
-    for l in thor_listings:
-        pos = l.get('position', 'Unknown')
-        by_position[pos] += 1
+        by_region[get('region', 'Unknown')] += 1
 
-    by_region = defaultdict(int)
-    for l in listings:
-        region = l.get('region', 'Unknown')
-        by_region[region] += 1
-
-    views_list = [l['views'] for l in listings if l.get('views') is not None]
-    saves_list = [l['saves'] for l in listings if l.get('saves') is not None]
+        views = get('views')
+        if views is not None:
+            views_count += 1
+            views_total += views
+        saves = get('saves')
+        if saves is not None:
+            saves_count += 1
+            saves_total += saves
 
     return {
         'total_listings': total,
         'thor_count': thor_count,
         'thor_pct': round(thor_count / total * 100, 1) if total > 0 else 0,
-        'by_tier': dict(by_tier),
+        'by_tier': by_tier,
         'by_year': dict(by_year),
         'by_brand': dict(by_brand),
         'by_position': dict(by_position),
         'by_region': dict(by_region),
         'engagement': {
-            'listings_with_views': len(views_list),
-            'total_views': sum(views_list) if views_list else 0,
-            'avg_views': round(sum(views_list) / len(views_list), 1) if views_list else 0,
-            'total_saves': sum(saves_list) if saves_list else 0,
-            'avg_saves': round(sum(saves_list) / len(saves_list), 1) if saves_list else 0,
+            'listings_with_views': views_count,
+            'total_views': views_total,
+            'avg_views': round(views_total / views_count, 1) if views_count else 0,
+            'total_saves': saves_total,
+            'avg_saves': round(saves_total / saves_count, 1) if saves_count else 0,
         },
     }
 
@@ -381,7 +421,9 @@ def consolidate(output_dir: Path, input_file: str = None) -> dict:
     tier_ceilings = calculate_tier_ceilings(listings)
     print(f"  Tier ceilings: {tier_ceilings}")
 
-    consolidated = [consolidate_listing(listing, engagement, tier_ceilings) for listing in listings]
+    # Per-run invariants are computed once, not per listing
+    now = datetime.now()
+    consolidated = [consolidate_listing(listing, engagement, tier_ceilings, now) for listing in listings]
 
     first = listings[0] if listings else {}
     search_context = {
@@ -410,9 +452,8 @@ def consolidate(output_dir: Path, input_file: str = None) -> dict:
 # HTML TEMPLATE
 # =============================================================================
 
-def get_html_template() -> str:
-    """Return the standalone dashboard HTML template."""
-    return '''<!DOCTYPE html>
+# Built once at import; get_html_template() hands back the same object
+HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -460,8 +501,11 @@ def get_html_template() -> str:
         .table th.sort-asc .sort-indicator::after { content: ' ▲'; opacity: 1; }
         .table th.sort-desc .sort-indicator::after { content: ' ▼'; opacity: 1; }
         .table td { padding: 0.4rem 0.35rem; vertical-align: middle; }
-        .table tbody tr { cursor: pointer; transition: all 0.15s ease; }
-        .table tbody tr:hover { background-color: #e3f2fd !important; transform: scale(1.002); box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        .table tbody tr { cursor: pointer; transition: background-color 0.15s ease; }
+        #list-view .table-wrapper { overflow-anchor: none; }
+        .table tbody tr.row-spacer { pointer-events: none; }
+        .table tbody tr.row-spacer > td { padding: 0; border: 0; box-shadow: none; }
+        .table tbody tr:hover { background-color: #e3f2fd !important; }
         .listing-link { color: #0d6efd; text-decoration: none; }
         .listing-link:hover { text-decoration: underline; }
         .badge-dominant { background: #198754; }
@@ -473,7 +517,7 @@ def get_html_template() -> str:
         .tier-tp { background: #198754; color: white; }
         .tier-p { background: #0d6efd; color: white; }
         .tier-s { background: #6c757d; color: white; }
-        #image-preview { display: none; position: fixed; z-index: 9999; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); color: white; border-radius: 8px; box-shadow: 0 4px 20px rgba(0,0,0,0.3); padding: 16px 20px; max-width: 280px; pointer-events: none; text-align: center; }
+        #image-preview { display: none; position: fixed; top: 0; left: 0; will-change: transform; z-index: 9999; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); color: white; border-radius: 8px; box-shadow: 0 4px 20px rgba(0,0,0,0.3); padding: 16px 20px; max-width: 280px; pointer-events: none; text-align: center; }
         #image-preview .preview-icon { font-size: 2.5rem; margin-bottom: 8px; }
         #image-preview .preview-title { font-size: 1rem; font-weight: 600; margin-bottom: 4px; }
         #image-preview .preview-hint { font-size: 0.8rem; opacity: 0.8; }
@@ -490,7 +534,7 @@ def get_html_template() -> str:
         .text-success { color: #198754 !important; }
         .text-warning { color: #856404 !important; }
         .text-danger { color: #dc3545 !important; }
-        .dealer-section { background: white; border-radius: 8px; margin-bottom: 1rem; box-shadow: 0 2px 4px rgba(0,0,0,0.05); overflow: hidden; }
+        .dealer-section { background: white; border-radius: 8px; margin-bottom: 1rem; box-shadow: 0 2px 4px rgba(0,0,0,0.05); overflow: hidden; content-visibility: auto; contain-intrinsic-size: auto 68px; }
         .dealer-header { background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%); color: white; padding: 0.75rem 1rem; display: flex; justify-content: space-between; align-items: center; cursor: pointer; }
         .dealer-header:hover { background: linear-gradient(135deg, #34495e 0%, #2c3e50 100%); }
         .dealer-name { font-weight: 600; font-size: 1rem; }
@@ -626,6 +670,31 @@ def get_html_template() -> str:
                         </thead>
                         <tbody id="table-body"></tbody>
                     </table>
+                    <template id="row-template">
+                        <tr>
+                            <td class="text-center fw-bold"></td>
+                            <td></td>
+                            <td></td>
+                            <td><a target="_blank" class="listing-link"></a></td>
+                            <td class="small"><span></span></td>
+                            <td class="vin-cell"><span></span></td>
+                            <td class="text-end"></td>
+                            <td class="text-center text-primary fw-bold"></td>
+                            <td class="text-center text-muted"></td>
+                            <td class="text-center"></td>
+                            <td class="text-center"></td>
+                            <td class="text-center"><span class="yn-badge"></span></td>
+                            <td class="text-center"></td>
+                            <td class="text-center"></td>
+                            <td class="text-center"><span class="badge" style="font-size:0.6rem"></span></td>
+                            <td class="text-center"><span class="badge" style="font-size:0.65rem"></span></td>
+                            <td class="text-center"></td>
+                            <td class="text-center small"></td>
+                            <td class="small"></td>
+                            <td class="small"></td>
+                            <td class="actions-cell"></td>
+                        </tr>
+                    </template>
                 </div>
             </div>
             <div id="dealer-view" style="display: none;"></div>
@@ -679,17 +748,94 @@ def get_html_template() -> str:
     </div>
 
     <script>
-        // EMBEDDED DATA - replaced at build time
-        const DATA = __EMBEDDED_DATA__;
+        // EMBEDDED DATA - replaced at build time (a --pack-data build embeds { packed: base64 of gzipped JSON })
+        let DATA = __EMBEDDED_DATA__;
+
+        // Listings arrive column-wise (one array per field); rebuild row objects once
+        function expandListings(columns) {
+            const fields = Object.keys(columns || {});
+            // Dictionary-encoded columns arrive as { values, codes }; plain columns as arrays
+            const data = fields.map(f => Array.isArray(columns[f]) ? [columns[f], null] : [columns[f].codes, columns[f].values]);
+            const count = fields.length ? data[0][0].length : 0;
+            const listings = new Array(count);
+            for (let i = 0; i < count; i++) {
+                const l = {};
+                for (let k = 0; k < fields.length; k++) {
+                    const [codes, values] = data[k];
+                    l[fields[k]] = values ? values[codes[i]] : codes[i];
+                }
+                listings[i] = l;
+            }
+            return listings;
+        }
 
-        let allListings = DATA.listings || [];
-        let filteredListings = [...allListings];
+        let allListings = [];
+        let filteredListings = [];
         let sortColumn = 'rank';
         let sortDirection = 'asc';
         let currentView = 'list';
+        // Select-based filters: element id -> listing field
+        const INDEXED_FILTERS = [['filter-brand', 'make'], ['filter-tier', 'tier'], ['filter-year', 'year'], ['filter-position', 'position'], ['filter-zip', 'search_zip'], ['filter-type', 'search_type'], ['filter-region', 'region']];
+        const NO_POSITIONS = new Uint32Array(0);
+        const filterIndex = {};
+        let dealerKeys = [];
+        let dealerCodes = new Uint32Array(0);
+        const dealerNames = [];
+        let lastSelectKey = null;
+        let lastDealerText = '';
+        const rowTemplate = document.getElementById('row-template').content.firstElementChild;
+        const sortHeaders = document.querySelectorAll('#data-table th[data-sort]');
+        const ROW_OVERSCAN = 20;
+        const DEALER_CHUNK_SIZE = 10;
+        let tableRows = [];
+        let rowWindow = { start: 0, end: 0, top: null, bottom: null };
+        let rowHeight = 40;
+        let scrollFramePending = false;
+        let hoverRow = null;
+        let previewPoint = null;
+        let previewFramePending = false;
+        let dealerViewListings = null;
+        let dealerRenderToken = 0;
+        let dealerGroups = [];
+        const DEALER_INPUT_DELAY_MS = 80;
+        let filterFramePending = false;
+        let dealerInputTimer = null;
+        const sortOrderCache = new Map();
+        const competitorStatsCache = new Map();
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        const HTML_ESCAPE_RE = /[&<>"']/g;
+        const TIER_LABELS = { 'top_premium': 'Top Premium', 'premium': 'Premium', 'standard': 'Standard' };
+        const TIER_CLASSES = { 'top_premium': 'tier-tp', 'premium': 'tier-p', 'standard': 'tier-s' };
+        const POSITION_CLASSES = { 'Dominant': 'badge-dominant', 'Strong': 'badge-strong', 'Competitive': 'badge-competitive', 'Neutral': 'badge-neutral', 'At Risk': 'badge-atrisk', 'Disadvantaged': 'badge-disadvantaged' };
+        const PRICE_FORMAT = new Intl.NumberFormat();
+        const DROP_DATE_FORMAT = new Intl.DateTimeFormat('en-US', { month: '2-digit', day: '2-digit', year: '2-digit' });
+
+        async function unpackData(packed) {
+            if (typeof DecompressionStream === 'undefined') {
+                throw new Error('this browser does not support DecompressionStream. Open the dashboard in a current Chrome, Edge, Firefox or Safari, or rebuild it without --pack-data.');
+            }
+            try {
+                const bytes = Uint8Array.from(atob(packed), c => c.charCodeAt(0));
+                const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+                return JSON.parse(await new Response(stream).text());
+            } catch (err) {
+                throw new Error(`the embedded data is corrupt (${err.message}). Rebuild the dashboard.`);
+            }
+        }
+
+        function showLoadError(message) {
+            const alert = document.createElement('div');
+            alert.className = 'alert alert-danger mt-3';
+            alert.textContent = `Could not load dashboard data: ${message}`;
+            document.querySelector('.container-fluid').prepend(alert);
+        }
 
         function init() {
+            allListings = expandListings(DATA.listing_columns);
+            filteredListings = [...allListings];
             document.getElementById('generated-at').textContent = `Generated: ${new Date(DATA.metadata?.generated_at).toLocaleString()}`;
+            prepareListings();
+            buildFilterIndex();
             renderMeta();
             populateFilters();
             renderStats();
@@ -697,6 +843,24 @@ def get_html_template() -> str:
             setupEventListeners();
         }
 
+        // Display values depend only on the listing, so derive them once instead of on every render
+        function prepareListings() {
+            allListings.forEach((l, i) => {
+                l.listingIndex = i;
+                l.tierLabel = TIER_LABELS[l.tier] || 'Standard';
+                l.tierClass = TIER_CLASSES[l.tier] || 'tier-s';
+                l.positionClass = getPositionClass(l.position);
+                l.photoClass = l.photo_count >= 35 ? 'text-success' : l.photo_count >= 20 ? 'text-warning' : 'text-danger';
+                l.viewsClass = l.views >= 100 ? 'text-success' : l.views >= 30 ? 'text-warning' : l.views != null ? 'text-danger' : '';
+                l.savesClass = l.saves >= 5 ? 'text-success' : l.saves >= 1 ? 'text-warning' : '';
+                l.daysClass = l.days_listed > 90 ? 'text-danger' : l.days_listed > 30 ? 'text-warning' : l.days_listed != null ? 'text-success' : '';
+                l.priceText = l.price ? `$${PRICE_FORMAT.format(Number(l.price))}` : '';
+                const dropDate = l.price_drop_date ? new Date(l.price_drop_date) : null;
+                l.priceDropText = !dropDate ? '-' : isNaN(dropDate) ? 'Invalid Date' : DROP_DATE_FORMAT.format(dropDate);
+                l.qualityCount = (l.has_price ? 1 : 0) + (l.has_vin ? 1 : 0) + (l.has_floorplan ? 1 : 0) + (l.length && l.length > 0 ? 1 : 0) + (l.photo_count >= 35 ? 1 : 0);
+            });
+        }
+
         function setView(view) {
             currentView = view;
             document.getElementById('view-list').classList.toggle('active', view === 'list');
@@ -716,13 +880,22 @@ def get_html_template() -> str:
             const zipFilter = document.getElementById('filter-zip')?.value || 'all';
             const typeFilter = document.getElementById('filter-type')?.value || 'all';
 
-            const uniqueZips = [...new Set(filteredListings.map(l => l.search_zip).filter(Boolean))];
-            const uniqueTypes = [...new Set(filteredListings.map(l => l.search_type).filter(Boolean))];
-            const uniqueRadii = [...new Set(filteredListings.map(l => l.search_radius).filter(Boolean))];
+            const uniqueZips = new Set(), uniqueTypes = new Set(), uniqueRadii = new Set();
+            let minRadius = Infinity, maxRadius = -Infinity;
+            for (const l of filteredListings) {
+                if (l.search_zip) uniqueZips.add(l.search_zip);
+                if (l.search_type) uniqueTypes.add(l.search_type);
+                const r = l.search_radius;
+                if (r) {
+                    uniqueRadii.add(r);
+                    if (r < minRadius) minRadius = r;
+                    if (r > maxRadius) maxRadius = r;
+                }
+            }
 
-            const zipDisplay = zipFilter !== 'all' ? zipFilter : (uniqueZips.length === 1 ? uniqueZips[0] : `${uniqueZips.length} zips`);
-            const typeDisplay = typeFilter !== 'all' ? typeFilter : (uniqueTypes.length === 1 ? uniqueTypes[0] : `${uniqueTypes.length} types`);
-            const radiusDisplay = uniqueRadii.length === 1 ? uniqueRadii[0] : (uniqueRadii.length > 0 ? `${Math.min(...uniqueRadii)}-${Math.max(...uniqueRadii)}` : 50);
+            const zipDisplay = zipFilter !== 'all' ? zipFilter : (uniqueZips.size === 1 ? uniqueZips.values().next().value : `${uniqueZips.size} zips`);
+            const typeDisplay = typeFilter !== 'all' ? typeFilter : (uniqueTypes.size === 1 ? uniqueTypes.values().next().value : `${uniqueTypes.size} types`);
+            const radiusDisplay = uniqueRadii.size === 1 ? minRadius : (uniqueRadii.size > 0 ? `${minRadius}-${maxRadius}` : 50);
 
             const tc = calculateTierCeilings(filteredListings);
 
@@ -736,12 +909,17 @@ def get_html_template() -> str:
         }
 
         function calculateTierCeilings(listings) {
-            const topPremiumRanks = listings.filter(l => l.is_top_premium).map(l => l.rank).filter(Boolean);
-            const premiumRanks = listings.filter(l => l.is_premium || l.is_top_premium).map(l => l.rank).filter(Boolean);
+            let topPremiumMax = -Infinity, premiumMax = -Infinity;
+            for (const l of listings) {
+                const rank = l.rank;
+                if (!rank) continue;
+                if (l.is_top_premium && rank > topPremiumMax) topPremiumMax = rank;
+                if ((l.is_premium || l.is_top_premium) && rank > premiumMax) premiumMax = rank;
+            }
             return {
                 top_premium: 1,
-                premium: topPremiumRanks.length > 0 ? Math.max(...topPremiumRanks) + 1 : 1,
-                standard: premiumRanks.length > 0 ? Math.max(...premiumRanks) + 1 : 1
+                premium: topPremiumMax > -Infinity ? topPremiumMax + 1 : 1,
+                standard: premiumMax > -Infinity ? premiumMax + 1 : 1
             };
         }
 
@@ -750,20 +928,19 @@ def get_html_template() -> str:
             const brand = document.getElementById('filter-brand')?.value || 'all';
             const thorOnly = document.getElementById('filter-thor')?.checked || false;
 
-            let brandListings, competitorListings;
-            if (brand !== 'all') {
-                brandListings = filteredListings;
-                competitorListings = allListings.filter(l => l.make !== brand);
-            } else if (thorOnly) {
-                brandListings = filteredListings;
-                competitorListings = allListings.filter(l => !l.is_thor);
-            } else {
-                brandListings = filteredListings;
-                competitorListings = [];
+            // The comparison group is every listing outside the brand (or outside Thor), whatever the other filters,
+            // so its stats are computed once per brand and reused across filter changes
+            const competitorKey = brand !== 'all' ? 'make:' + brand : thorOnly ? 'thor' : null;
+            let compStats = null;
+            if (competitorKey) {
+                compStats = competitorStatsCache.get(competitorKey);
+                if (compStats === undefined) {
+                    const competitorListings = brand !== 'all' ? allListings.filter(l => l.make !== brand) : allListings.filter(l => !l.is_thor);
+                    compStats = competitorListings.length > 0 ? calcStats(competitorListings) : null;
+                    competitorStatsCache.set(competitorKey, compStats);
+                }
             }
-
-            const stats = calcStats(brandListings);
-            const compStats = competitorListings.length > 0 ? calcStats(competitorListings) : null;
+            const stats = calcStats(filteredListings);
 
             const fmt = (val, decimals = 0) => val == null || isNaN(val) ? '-' : val.toFixed(decimals);
 
@@ -792,94 +969,194 @@ def get_html_template() -> str:
             const empty = { total: 0, avgRank: 0, avgViews: 0, avgSaves: 0, avgPhotos: 0, premiumPct: 0, qualityScore: 0, tp: 0, p: 0, s: 0 };
             if (!listings || !listings.length) return empty;
 
+            // Single pass: no intermediate arrays per metric
             const total = listings.length;
-            const ranks = listings.map(l => l.rank).filter(r => r != null && !isNaN(r) && r > 0);
-            const views = listings.map(l => l.views).filter(v => v != null && !isNaN(v));
-            const saves = listings.map(l => l.saves).filter(s => s != null && !isNaN(s));
-            const photos = listings.map(l => l.photo_count || 0);
-
-            const premium = listings.filter(l => l.tier === 'top_premium' || l.tier === 'premium').length;
-            const tp = listings.filter(l => l.tier === 'top_premium').length;
-            const p = listings.filter(l => l.tier === 'premium').length;
-            const s = listings.filter(l => l.tier === 'standard').length;
-
-            const withPrice = listings.filter(l => l.has_price).length;
-            const withVin = listings.filter(l => l.has_vin).length;
-            const withFP = listings.filter(l => l.has_floorplan).length;
-            const withLength = listings.filter(l => l.length && l.length > 0).length;
-            const with35Photos = listings.filter(l => l.photo_count >= 35).length;
-            const qualityScore = total > 0 ? (withPrice + withVin + withFP + withLength + with35Photos) / (total * 5) * 100 : 0;
-
-            const safeAvg = (arr) => arr.length > 0 ? arr.reduce((a,b) => a+b, 0) / arr.length : 0;
-
-            return { total, avgRank: safeAvg(ranks), avgViews: safeAvg(views), avgSaves: safeAvg(saves), avgPhotos: safeAvg(photos), premiumPct: total > 0 ? (premium / total) * 100 : 0, qualityScore: isNaN(qualityScore) ? 0 : qualityScore, tp, p, s };
+            let rankSum = 0, rankN = 0, viewsSum = 0, viewsN = 0, savesSum = 0, savesN = 0, photoSum = 0, qualityPoints = 0;
+            let tp = 0, p = 0, s = 0;
+            for (const l of listings) {
+                const r = l.rank, v = l.views, sv = l.saves;
+                if (r != null && !isNaN(r) && r > 0) { rankSum += r; rankN++; }
+                if (v != null && !isNaN(v)) { viewsSum += v; viewsN++; }
+                if (sv != null && !isNaN(sv)) { savesSum += sv; savesN++; }
+                photoSum += l.photo_count || 0;
+                qualityPoints += l.qualityCount;
+                if (l.tier === 'top_premium') tp++;
+                else if (l.tier === 'premium') p++;
+                else if (l.tier === 'standard') s++;
+            }
+            const qualityScore = qualityPoints / (total * 5) * 100;
+
+            return { total, avgRank: rankN ? rankSum / rankN : 0, avgViews: viewsN ? viewsSum / viewsN : 0, avgSaves: savesN ? savesSum / savesN : 0, avgPhotos: photoSum / total, premiumPct: ((tp + p) / total) * 100, qualityScore: isNaN(qualityScore) ? 0 : qualityScore, tp, p, s };
         }
 
         function renderTable() {
-            const tbody = document.getElementById('table-body');
-            const sorted = sortListings(filteredListings);
-
-            tbody.innerHTML = sorted.map(l => {
-                const tierLabel = { 'top_premium': 'Top Premium', 'premium': 'Premium', 'standard': 'Standard' }[l.tier] || 'Standard';
-                const tierClass = { 'top_premium': 'tier-tp', 'premium': 'tier-p', 'standard': 'tier-s' }[l.tier] || 'tier-s';
-                const posClass = getPositionClass(l.position);
-                const photoClass = l.photo_count >= 35 ? 'text-success' : l.photo_count >= 20 ? 'text-warning' : 'text-danger';
-                const viewsClass = l.views >= 100 ? 'text-success' : l.views >= 30 ? 'text-warning' : l.views != null ? 'text-danger' : '';
-                const savesClass = l.saves >= 5 ? 'text-success' : l.saves >= 1 ? 'text-warning' : '';
-                const daysClass = l.days_listed > 90 ? 'text-danger' : l.days_listed > 30 ? 'text-warning' : l.days_listed != null ? 'text-success' : '';
-                const price = l.price ? `$${Number(l.price).toLocaleString()}` : '<span class="text-danger">-</span>';
-                const improvementList = l.improvements || [];
-                const actions = improvementList.length > 0 ? improvementList.map(imp => `<div class="action-item">${escapeHtml(imp)}</div>`).join('') : '<span class="text-success">OK</span>';
-                const rel = l.relevance_score ? Math.round(l.relevance_score) : '-';
-                const merch = l.merch_score ? Math.round(l.merch_score) : '-';
-                const vinDisplay = l.vin ? `<span class="vin-text">${escapeHtml(l.vin)}</span>` : '<span class="text-muted">-</span>';
-                const stockDisplay = l.stock_number ? `<span class="small">${escapeHtml(l.stock_number)}</span>` : '<span class="text-muted">-</span>';
-                const priceDropDisplay = l.price_drop_date ? new Date(l.price_drop_date).toLocaleDateString('en-US', { month: '2-digit', day: '2-digit', year: '2-digit' }) : '-';
-
-                return `<tr data-url="${l.listing_url || ''}">
-                    <td class="text-center fw-bold">${l.rank || '-'}</td>
-                    <td>${l.year || '-'}</td>
-                    <td>${escapeHtml(l.make || '')}</td>
-                    <td><a href="${l.listing_url || '#'}" target="_blank" class="listing-link">${escapeHtml((l.model || '').substring(0, 18))}</a></td>
-                    <td class="small">${stockDisplay}</td>
-                    <td class="vin-cell">${vinDisplay}</td>
-                    <td class="text-end">${price}</td>
-                    <td class="text-center text-primary fw-bold">${rel}</td>
-                    <td class="text-center text-muted">${merch}</td>
-                    <td class="text-center">${l.length ? l.length + "'" : '-'}</td>
-                    <td class="text-center ${photoClass}">${l.photo_count || 0}</td>
-                    <td class="text-center"><span class="yn-badge ${l.has_floorplan ? 'yn-yes' : 'yn-no'}">${l.has_floorplan ? 'Y' : 'N'}</span></td>
-                    <td class="text-center ${viewsClass}">${l.views != null ? l.views : '-'}</td>
-                    <td class="text-center ${savesClass}">${l.saves != null ? l.saves : '-'}</td>
-                    <td class="text-center"><span class="badge ${tierClass}" style="font-size:0.6rem">${tierLabel}</span></td>
-                    <td class="text-center"><span class="badge ${posClass}" style="font-size:0.65rem">${l.position || '-'}</span></td>
-                    <td class="text-center ${daysClass}">${l.days_listed != null ? l.days_listed : '-'}</td>
-                    <td class="text-center small">${priceDropDisplay}</td>
-                    <td class="small">${l.city ? escapeHtml(l.city) + ', ' : ''}${l.state || '-'}</td>
-                    <td class="small">${escapeHtml((l.dealer_name || '').substring(0, 18))}</td>
-                    <td class="actions-cell">${actions}</td>
-                </tr>`;
-            }).join('');
-
-            document.querySelectorAll('#data-table th').forEach(th => {
+            tableRows = sortListings(filteredListings);
+            rowWindow = { start: 0, end: 0, top: null, bottom: null };
+            renderTableWindow();
+
+            for (const th of sortHeaders) {
                 th.classList.remove('sort-asc', 'sort-desc');
                 if (th.dataset.sort === sortColumn) th.classList.add(sortDirection === 'asc' ? 'sort-asc' : 'sort-desc');
-            });
+            }
+        }
 
-            setupRowHover();
+        // Virtualized list: only rows near the viewport exist in the DOM; spacer rows stand in for the rest.
+        // Row heights vary (action lists), so a re-render keeps the row at the top of the viewport fixed on screen.
+        function renderTableWindow() {
+            const wrapper = document.querySelector('#list-view .table-wrapper');
+            const tbody = document.getElementById('table-body');
+            const total = tableRows.length;
+            const wrapTop = wrapper.getBoundingClientRect().top;
+            const bodyTop = tbody.getBoundingClientRect().top - wrapTop + wrapper.scrollTop;
+            const viewHeight = Math.max(wrapper.clientHeight, window.innerHeight * 0.75);
+            const margin = ROW_OVERSCAN / 2 * rowHeight;
+            const { start: oldStart, end: oldEnd, top: oldTop, bottom: oldBottom } = rowWindow;
+
+            let anchor = -1, anchorOffset = 0;
+            if (oldEnd > oldStart) {
+                const topEdge = oldTop ? oldTop.getBoundingClientRect().bottom - wrapTop : -Infinity;
+                const bottomEdge = oldBottom ? oldBottom.getBoundingClientRect().top - wrapTop : Infinity;
+                if (topEdge < -margin && bottomEdge > viewHeight + margin) return;
+                // First rendered row still crossing the viewport top becomes the anchor
+                const rows = tbody.rows;
+                for (let i = oldTop ? 1 : 0, idx = oldStart; idx < oldEnd; i++, idx++) {
+                    const rect = rows[i].getBoundingClientRect();
+                    if (rect.bottom - wrapTop > 0) {
+                        if (rect.top - wrapTop <= viewHeight) { anchor = idx; anchorOffset = rect.top - wrapTop; }
+                        break;
+                    }
+                }
+            }
+            if (anchor < 0) {
+                // Nothing rendered in view (first render or a jump): place by estimated row height
+                anchor = Math.max(0, Math.min(Math.floor((wrapper.scrollTop - bodyTop) / rowHeight), total - 1));
+                anchorOffset = bodyTop + anchor * rowHeight - wrapper.scrollTop;
+            }
+
+            // Keep the start odd so the top spacer does not flip table-striped row parity
+            let start = Math.max(0, anchor - ROW_OVERSCAN);
+            if (start % 2 === 0 && start > 0) start--;
+            const end = Math.min(total, anchor + Math.ceil(viewHeight / rowHeight) + ROW_OVERSCAN);
+
+            const frag = document.createDocumentFragment();
+            const top = start > 0 ? frag.appendChild(spacerRow(start * rowHeight)) : null;
+            for (let i = start; i < end; i++) frag.appendChild(buildTableRow(tableRows[i]));
+            const bottom = end < total ? frag.appendChild(spacerRow((total - end) * rowHeight)) : null;
+            tbody.replaceChildren(frag);
+            rowWindow = { start, end, top, bottom };
+            if (end <= start) return;
+
+            // Shift the top spacer (or scroll) so the anchor row lands where it was
+            const anchorRow = tbody.rows[anchor - start + (top ? 1 : 0)];
+            const drift = anchorRow.getBoundingClientRect().top - wrapTop - anchorOffset;
+            let topHeight = 0, shift = drift;
+            if (top) {
+                topHeight = Math.max(0, start * rowHeight - drift);
+                top.firstChild.style.height = `${topHeight}px`;
+                shift = drift - start * rowHeight + topHeight;
+            }
+            if (shift) wrapper.scrollTop += shift;
+
+            // Refine the row height estimate from the rows actually rendered
+            const measured = (tbody.offsetHeight - topHeight - (bottom ? bottom.offsetHeight : 0)) / (end - start);
+            if (measured > 0) rowHeight = measured;
+
+        }
+
+        function spacerRow(height) {
+            const row = document.createElement('tr');
+            row.className = 'row-spacer';
+            const cell = row.insertCell();
+            cell.colSpan = rowTemplate.cells.length;
+            cell.style.height = `${height}px`;
+            return row;
+        }
+
+        // Clone the <template> row and fill cells in column order (no HTML parsing or escaping needed)
+        function buildTableRow(l) {
+            const row = rowTemplate.cloneNode(true);
+            const c = row.cells;
+            row.dataset.url = l.listing_url || '';
+            c[0].textContent = l.rank || '-';
+            c[1].textContent = l.year || '-';
+            c[2].textContent = l.make || '';
+            const link = c[3].firstChild;
+            link.href = l.listing_url || '#';
+            link.textContent = (l.model || '').substring(0, 18);
+            setTextSpan(c[4].firstChild, l.stock_number, 'small');
+            setTextSpan(c[5].firstChild, l.vin, 'vin-text');
+            if (l.priceText) c[6].textContent = l.priceText;
+            else appendSpan(c[6], 'text-danger', '-');
+            c[7].textContent = l.relevance_score ? Math.round(l.relevance_score) : '-';
+            c[8].textContent = l.merch_score ? Math.round(l.merch_score) : '-';
+            c[9].textContent = l.length ? l.length + "'" : '-';
+            c[10].className = `text-center ${l.photoClass}`;
+            c[10].textContent = l.photo_count || 0;
+            const fp = c[11].firstChild;
+            fp.className = `yn-badge ${l.has_floorplan ? 'yn-yes' : 'yn-no'}`;
+            fp.textContent = l.has_floorplan ? 'Y' : 'N';
+            c[12].className = `text-center ${l.viewsClass}`;
+            c[12].textContent = l.views != null ? l.views : '-';
+            c[13].className = `text-center ${l.savesClass}`;
+            c[13].textContent = l.saves != null ? l.saves : '-';
+            c[14].firstChild.className = `badge ${l.tierClass}`;
+            c[14].firstChild.textContent = l.tierLabel;
+            c[15].firstChild.className = `badge ${l.positionClass}`;
+            c[15].firstChild.textContent = l.position || '-';
+            c[16].className = `text-center ${l.daysClass}`;
+            c[16].textContent = l.days_listed != null ? l.days_listed : '-';
+            c[17].textContent = l.priceDropText;
+            c[18].textContent = `${l.city ? l.city + ', ' : ''}${l.state || '-'}`;
+            c[19].textContent = (l.dealer_name || '').substring(0, 18);
+            const improvementList = l.improvements || [];
+            if (improvementList.length > 0) {
+                for (const imp of improvementList) {
+                    const item = document.createElement('div');
+                    item.className = 'action-item';
+                    item.textContent = imp;
+                    c[20].appendChild(item);
+                }
+            } else {
+                appendSpan(c[20], 'text-success', 'OK');
+            }
+            return row;
+        }
+
+        // Fill a template span with a value, or a muted '-' placeholder when the value is empty
+        function setTextSpan(span, value, className) {
+            span.className = value ? className : 'text-muted';
+            span.textContent = value || '-';
+        }
+
+        function appendSpan(parent, className, text) {
+            const span = document.createElement('span');
+            span.className = className;
+            span.textContent = text;
+            parent.appendChild(span);
         }
 
         function renderDealerView() {
+            // The dealer view ignores the table sort, so it only goes stale when the filtered set changes
+            if (dealerViewListings === filteredListings) return;
+            dealerViewListings = filteredListings;
             const container = document.getElementById('dealer-view');
-            const dealerMap = {};
-            filteredListings.forEach(l => {
-                const dealer = l.dealer_name || 'Unknown Dealer';
-                if (!dealerMap[dealer]) dealerMap[dealer] = { name: dealer, listings: [], id: l.dealer_id };
-                dealerMap[dealer].listings.push(l);
-            });
+            // Counting sort on the dealer codes: size each group first, then drop listings straight into place
+            const counts = new Uint32Array(dealerNames.length);
+            const seen = [];
+            for (const l of filteredListings) {
+                const code = dealerCodes[l.listingIndex];
+                if (counts[code]++ === 0) seen.push(code);
+            }
+            const groups = new Array(dealerNames.length);
+            for (const code of seen) groups[code] = { name: dealerNames[code], listings: new Array(counts[code]), filled: 0 };
+            for (const l of filteredListings) {
+                const group = groups[dealerCodes[l.listingIndex]];
+                group.listings[group.filled++] = l;
+            }
 
             const avgAll = calcStats(filteredListings);
-            const dealers = Object.values(dealerMap).sort((a, b) => b.listings.length - a.listings.length);
+            const dealers = seen.map(code => groups[code]).sort((a, b) => b.listings.length - a.listings.length);
+            dealerGroups = dealers;
 
             const fmt = (val, decimals = 0) => val == null || isNaN(val) ? '-' : val.toFixed(decimals);
             const calcDelta = (dealerVal, allVal, inverse = false) => {
@@ -890,7 +1167,7 @@ def get_html_template() -> str:
                 return { value: diff.toFixed(1), cls, sign };
             };
 
-            container.innerHTML = dealers.map((d, idx) => {
+            const renderSection = (d, idx) => {
                 const avg = calcStats(d.listings);
                 const rankDelta = calcDelta(avg.avgRank, avgAll.avgRank, true);
                 const viewsDelta = calcDelta(avg.avgViews, avgAll.avgViews);
@@ -909,108 +1186,184 @@ def get_html_template() -> str:
                             <div class="dealer-stat"><div class="dealer-stat-value">${fmt(avg.premiumPct)}%</div><div class="dealer-stat-label">Premium</div></div>
                         </div>
                     </div>
-                    <div class="dealer-listings" id="dealer-${idx}" style="display: none;">
-                        <div class="table-wrapper" style="max-height: 400px;">
-                            <table class="table table-striped table-hover mb-0">
-                                <thead><tr><th>Rank</th><th>Year</th><th>Model</th><th>Stock#</th><th>VIN</th><th>Price</th><th>Rel</th><th>Merch</th><th>Length</th><th>Photos</th><th>FP</th><th>Views</th><th>Saves</th><th>Days</th><th>Location</th><th>Tier</th><th>Position</th><th>Actions</th></tr></thead>
-                                <tbody>${d.listings.sort((a,b) => a.rank - b.rank).map(l => {
-                                    const tierLabel = { 'top_premium': 'Top Premium', 'premium': 'Premium', 'standard': 'Standard' }[l.tier] || 'Standard';
-                                    const tierClass = { 'top_premium': 'tier-tp', 'premium': 'tier-p', 'standard': 'tier-s' }[l.tier] || 'tier-s';
-                                    const posClass = getPositionClass(l.position);
-                                    const photoClass = l.photo_count >= 35 ? 'text-success' : l.photo_count >= 20 ? 'text-warning' : 'text-danger';
-                                    const viewsClass = l.views >= 100 ? 'text-success' : l.views >= 30 ? 'text-warning' : l.views != null ? 'text-danger' : '';
-                                    const daysClass = l.days_listed > 90 ? 'text-danger' : l.days_listed > 30 ? 'text-warning' : 'text-success';
-                                    const price = l.price ? `$${Number(l.price).toLocaleString()}` : '-';
-                                    const improvementList = l.improvements || [];
-                                    const actions = improvementList.length > 0 ? improvementList.map(imp => `<div class="action-item">${escapeHtml(imp)}</div>`).join('') : '<span class="text-success">OK</span>';
-                                    const vinDisplay = l.vin ? `<span class="vin-text">${escapeHtml(l.vin)}</span>` : '-';
-                                    return `<tr data-url="${l.listing_url || ''}">
-                                        <td class="text-center fw-bold">${l.rank}</td><td>${l.year}</td>
-                                        <td><a href="${l.listing_url || '#'}" target="_blank" class="listing-link">${escapeHtml((l.model || '').substring(0, 18))}</a></td>
-                                        <td class="small">${l.stock_number || '-'}</td><td class="vin-cell">${vinDisplay}</td>
-                                        <td class="text-end">${price}</td><td class="text-center text-primary fw-bold">${l.relevance_score ? Math.round(l.relevance_score) : '-'}</td>
-                                        <td class="text-center text-muted">${l.merch_score ? Math.round(l.merch_score) : '-'}</td>
-                                        <td class="text-center">${l.length ? l.length + "'" : '-'}</td><td class="text-center ${photoClass}">${l.photo_count || 0}</td>
-                                        <td class="text-center"><span class="yn-badge ${l.has_floorplan ? 'yn-yes' : 'yn-no'}">${l.has_floorplan ? 'Y' : 'N'}</span></td>
-                                        <td class="text-center ${viewsClass}">${l.views != null ? l.views : '-'}</td>
-                                        <td class="text-center">${l.saves != null ? l.saves : '-'}</td>
-                                        <td class="text-center ${daysClass}">${l.days_listed != null ? l.days_listed : '-'}</td>
-                                        <td class="small">${l.city ? escapeHtml(l.city) + ', ' : ''}${l.state || '-'}</td>
-                                        <td class="text-center"><span class="badge ${tierClass}" style="font-size:0.7rem">${tierLabel}</span></td>
-                                        <td class="text-center"><span class="badge ${posClass}" style="font-size:0.7rem">${l.position}</span></td>
-                                        <td class="actions-cell">${actions}</td>
-                                    </tr>`;
-                                }).join('')}</tbody>
-                            </table>
-                        </div>
-                    </div>
+                    <div class="dealer-listings" id="dealer-${idx}" style="display: none;"></div>
                 </div>`;
-            }).join('');
+            };
+
+            // Commit the first sections now and the rest a chunk per frame; a newer render abandons this one
+            const token = ++dealerRenderToken;
+            let next = 0;
+            const renderChunk = () => {
+                if (token !== dealerRenderToken) return;
+                const end = Math.min(next + DEALER_CHUNK_SIZE, dealers.length);
+                const parts = new Array(end - next);
+                for (let idx = next; idx < end; idx++) parts[idx - next] = renderSection(dealers[idx], idx);
+                container.insertAdjacentHTML('beforeend', parts.join(''));
+                next = end;
+                if (next < dealers.length) requestAnimationFrame(renderChunk);
+            };
+            container.textContent = '';
+            renderChunk();
+        }
 
-            setupRowHover();
+        // Dealer tables start collapsed, so each is built the first time its section is opened
+        function buildDealerTableHtml(listings) {
+            return `<div class="table-wrapper" style="max-height: 400px;">
+                <table class="table table-striped table-hover mb-0">
+                    <thead><tr><th>Rank</th><th>Year</th><th>Model</th><th>Stock#</th><th>VIN</th><th>Price</th><th>Rel</th><th>Merch</th><th>Length</th><th>Photos</th><th>FP</th><th>Views</th><th>Saves</th><th>Days</th><th>Location</th><th>Tier</th><th>Position</th><th>Actions</th></tr></thead>
+                    <tbody>${listings.sort((a,b) => a.rank - b.rank).map(l => l.dealerRowHtml || (l.dealerRowHtml = buildDealerRowHtml(l))).join('')}</tbody>
+                </table>
+            </div>`;
+        }
+
+        // A dealer-view row depends only on its listing, so its markup is built once and reused across renders
+        function buildDealerRowHtml(l) {
+            const daysClass = l.days_listed > 90 ? 'text-danger' : l.days_listed > 30 ? 'text-warning' : 'text-success';
+            const improvementList = l.improvements || [];
+            const actions = improvementList.length > 0 ? improvementList.map(imp => `<div class="action-item">${escapeHtml(imp)}</div>`).join('') : '<span class="text-success">OK</span>';
+            const vinDisplay = l.vin ? `<span class="vin-text">${escapeHtml(l.vin)}</span>` : '-';
+            return `<tr data-url="${l.listing_url || ''}">
+                <td class="text-center fw-bold">${l.rank}</td><td>${l.year}</td>
+                <td><a href="${l.listing_url || '#'}" target="_blank" class="listing-link">${escapeHtml((l.model || '').substring(0, 18))}</a></td>
+                <td class="small">${l.stock_number || '-'}</td><td class="vin-cell">${vinDisplay}</td>
+                <td class="text-end">${l.priceText || '-'}</td><td class="text-center text-primary fw-bold">${l.relevance_score ? Math.round(l.relevance_score) : '-'}</td>
+                <td class="text-center text-muted">${l.merch_score ? Math.round(l.merch_score) : '-'}</td>
+                <td class="text-center">${l.length ? l.length + "'" : '-'}</td><td class="text-center ${l.photoClass}">${l.photo_count || 0}</td>
+                <td class="text-center"><span class="yn-badge ${l.has_floorplan ? 'yn-yes' : 'yn-no'}">${l.has_floorplan ? 'Y' : 'N'}</span></td>
+                <td class="text-center ${l.viewsClass}">${l.views != null ? l.views : '-'}</td>
+                <td class="text-center">${l.saves != null ? l.saves : '-'}</td>
+                <td class="text-center ${daysClass}">${l.days_listed != null ? l.days_listed : '-'}</td>
+                <td class="small">${l.city ? escapeHtml(l.city) + ', ' : ''}${l.state || '-'}</td>
+                <td class="text-center"><span class="badge ${l.tierClass}" style="font-size:0.7rem">${l.tierLabel}</span></td>
+                <td class="text-center"><span class="badge ${l.positionClass}" style="font-size:0.7rem">${l.position}</span></td>
+                <td class="actions-cell">${actions}</td>
+            </tr>`;
         }
 
         function toggleDealer(idx) {
             const el = document.getElementById('dealer-' + idx);
+            if (!el.firstChild) el.innerHTML = buildDealerTableHtml(dealerGroups[idx].listings);
             el.style.display = el.style.display === 'none' ? 'block' : 'none';
-            setupRowHover();
         }
 
         function getPositionClass(position) {
-            return { 'Dominant': 'badge-dominant', 'Strong': 'badge-strong', 'Competitive': 'badge-competitive', 'Neutral': 'badge-neutral', 'At Risk': 'badge-atrisk', 'Disadvantaged': 'badge-disadvantaged' }[position] || 'bg-secondary';
+            return POSITION_CLASSES[position] || 'bg-secondary';
         }
 
         function escapeHtml(str) {
-            const div = document.createElement('div');
-            div.textContent = str;
-            return div.innerHTML;
+            return str == null ? '' : String(str).replace(HTML_ESCAPE_RE, c => HTML_ESCAPES[c]);
+        }
+
+        // Distinct non-empty values of an indexed field with their listing counts, read off the filter index
+        function fieldValueCounts(field) {
+            const counts = new Map();
+            for (const positions of filterIndex[field].positions) {
+                const value = allListings[positions[0]][field];
+                if (value) counts.set(value, positions.length);
+            }
+            return counts;
         }
 
         function populateFilters() {
-            const brands = [...new Set(allListings.map(l => l.make).filter(Boolean))].sort();
+            const brands = [...fieldValueCounts('make').keys()].sort();
             const brandSelect = document.getElementById('filter-brand');
             brands.forEach(b => { const opt = document.createElement('option'); opt.value = b; opt.textContent = b; brandSelect.appendChild(opt); });
 
-            const years = [...new Set(allListings.map(l => l.year).filter(Boolean))].sort((a, b) => b - a);
+            const years = [...fieldValueCounts('year').keys()].sort((a, b) => b - a);
             const yearSelect = document.getElementById('filter-year');
             years.forEach(y => { const opt = document.createElement('option'); opt.value = y; opt.textContent = y; yearSelect.appendChild(opt); });
 
-            const searchZips = [...new Set(allListings.map(l => l.search_zip).filter(Boolean))].sort();
+            const zipCounts = fieldValueCounts('search_zip');
+            const searchZips = [...zipCounts.keys()].sort();
             const zipSelect = document.getElementById('filter-zip');
-            searchZips.forEach(z => { const opt = document.createElement('option'); opt.value = z; const count = allListings.filter(l => l.search_zip === z).length; opt.textContent = `${z} (${count})`; zipSelect.appendChild(opt); });
+            searchZips.forEach(z => { const opt = document.createElement('option'); opt.value = z; opt.textContent = `${z} (${zipCounts.get(z)})`; zipSelect.appendChild(opt); });
 
-            const searchTypes = [...new Set(allListings.map(l => l.search_type).filter(Boolean))].sort();
+            const typeCounts = fieldValueCounts('search_type');
+            const searchTypes = [...typeCounts.keys()].sort();
             const typeSelect = document.getElementById('filter-type');
-            searchTypes.forEach(t => { const opt = document.createElement('option'); opt.value = t; const count = allListings.filter(l => l.search_type === t).length; opt.textContent = `${t} (${count})`; typeSelect.appendChild(opt); });
+            searchTypes.forEach(t => { const opt = document.createElement('option'); opt.value = t; opt.textContent = `${t} (${typeCounts.get(t)})`; typeSelect.appendChild(opt); });
 
-            const regions = [...new Set(allListings.map(l => l.region).filter(Boolean))].sort();
+            const regions = [...fieldValueCounts('region').keys()].sort();
             const regionSelect = document.getElementById('filter-region');
             regions.forEach(r => { const opt = document.createElement('option'); opt.value = r; opt.textContent = r; regionSelect.appendChild(opt); });
         }
 
+        // Built once per filtered field: a dictionary code per listing (codes), value (as string) -> code (lookup),
+        // and the ascending allListings positions holding each code (positions)
+        function buildFilterIndex() {
+            for (const field of [...INDEXED_FILTERS.map(([, f]) => f), 'is_thor']) {
+                const lookup = new Map();
+                const codes = new Uint32Array(allListings.length);
+                const buckets = [];
+                allListings.forEach((l, i) => {
+                    const key = String(l[field]);
+                    let code = lookup.get(key);
+                    if (code === undefined) {
+                        code = buckets.length;
+                        lookup.set(key, code);
+                        buckets.push([]);
+                    }
+                    codes[i] = code;
+                    buckets[code].push(i);
+                });
+                filterIndex[field] = { codes, lookup, positions: buckets.map(bucket => Uint32Array.from(bucket)) };
+            }
+            dealerKeys = allListings.map(l => (l.dealer_name || '').toLowerCase());
+            const dealerLookup = new Map();
+            dealerCodes = new Uint32Array(allListings.length);
+            allListings.forEach((l, i) => {
+                const name = l.dealer_name || 'Unknown Dealer';
+                let code = dealerLookup.get(name);
+                if (code === undefined) {
+                    code = dealerNames.length;
+                    dealerLookup.set(name, code);
+                    dealerNames.push(name);
+                }
+                dealerCodes[i] = code;
+            });
+        }
+
+        function activeFilter(field, value) {
+            const index = filterIndex[field];
+            const code = index.lookup.get(value);
+            return { codes: index.codes, code, positions: code === undefined ? NO_POSITIONS : index.positions[code] };
+        }
+
         function applyFilters() {
-            const brand = document.getElementById('filter-brand').value;
-            const tier = document.getElementById('filter-tier').value;
-            const year = document.getElementById('filter-year').value;
-            const position = document.getElementById('filter-position').value;
             const dealer = document.getElementById('filter-dealer').value.toLowerCase();
+            const active = [];
+            let selectKey = '';
+            for (const [id, field] of INDEXED_FILTERS) {
+                const value = document.getElementById(id).value;
+                selectKey += value + '\\u0000';
+                if (value !== 'all') active.push(activeFilter(field, value));
+            }
             const thorOnly = document.getElementById('filter-thor').checked;
-            const zip = document.getElementById('filter-zip').value;
-            const type = document.getElementById('filter-type').value;
-            const region = document.getElementById('filter-region').value;
-
-            filteredListings = allListings.filter(l => {
-                if (brand !== 'all' && l.make !== brand) return false;
-                if (tier !== 'all' && l.tier !== tier) return false;
-                if (year !== 'all' && l.year != year) return false;
-                if (position !== 'all' && l.position !== position) return false;
-                if (dealer && !(l.dealer_name || '').toLowerCase().includes(dealer)) return false;
-                if (thorOnly && !l.is_thor) return false;
-                if (zip !== 'all' && l.search_zip !== zip) return false;
-                if (type !== 'all' && l.search_type !== type) return false;
-                if (region !== 'all' && l.region !== region) return false;
-                return true;
-            });
+            selectKey += thorOnly;
+            if (thorOnly) active.push(activeFilter('is_thor', 'true'));
+
+            // Typing more of the dealer name can only narrow the current result, so refine it instead of rescanning
+            const narrowing = selectKey === lastSelectKey && dealer.includes(lastDealerText);
+            lastSelectKey = selectKey;
+            lastDealerText = dealer;
+
+            if (narrowing) {
+                filteredListings = filteredListings.filter(l => dealerKeys[l.listingIndex].includes(dealer));
+            } else {
+                // Walk only the smallest matching bucket and compare the other filters' codes per position
+                active.sort((a, b) => a.positions.length - b.positions.length);
+                const candidates = active.length ? active[0].positions : null;
+                const count = candidates ? candidates.length : allListings.length;
+                filteredListings = [];
+                outer: for (let k = 0; k < count; k++) {
+                    const i = candidates ? candidates[k] : k;
+                    for (let f = 1; f < active.length; f++) {
+                        if (active[f].codes[i] !== active[f].code) continue outer;
+                    }
+                    if (dealer && !dealerKeys[i].includes(dealer)) continue;
+                    filteredListings.push(allListings[i]);
+                }
+            }
 
             const queryCount = document.getElementById('query-count');
             if (queryCount) queryCount.textContent = `${filteredListings.length} listings`;
@@ -1020,6 +1373,13 @@ def get_html_template() -> str:
             renderCurrentView();
         }
 
+        // Coalesce bursts of filter events into a single applyFilters per animation frame
+        function scheduleFilters() {
+            if (filterFramePending) return;
+            filterFramePending = true;
+            requestAnimationFrame(() => { filterFramePending = false; applyFilters(); });
+        }
+
         function resetFilters() {
             document.getElementById('filter-brand').value = 'all';
             document.getElementById('filter-tier').value = 'all';
@@ -1033,17 +1393,33 @@ def get_html_template() -> str:
             applyFilters();
         }
 
+        // Each column/direction is sorted once over allListings; a filtered view is a linear pass over that order
         function sortListings(listings) {
-            return [...listings].sort((a, b) => {
-                let valA = a[sortColumn], valB = b[sortColumn];
-                if (valA == null) valA = sortDirection === 'asc' ? Infinity : -Infinity;
-                if (valB == null) valB = sortDirection === 'asc' ? Infinity : -Infinity;
-                if (typeof valA === 'number' && typeof valB === 'number') return sortDirection === 'asc' ? valA - valB : valB - valA;
-                valA = String(valA).toLowerCase(); valB = String(valB).toLowerCase();
-                if (valA < valB) return sortDirection === 'asc' ? -1 : 1;
-                if (valA > valB) return sortDirection === 'asc' ? 1 : -1;
-                return 0;
+            const key = `${sortColumn}:${sortDirection}`;
+            let order = sortOrderCache.get(key);
+            if (!order) {
+                order = sortByColumn(allListings, sortColumn, sortDirection);
+                sortOrderCache.set(key, order);
+            }
+            if (listings.length === allListings.length) return order;
+            const keep = new Uint8Array(allListings.length);
+            for (const l of listings) keep[l.listingIndex] = 1;
+            return order.filter(l => keep[l.listingIndex]);
+        }
+
+        // Derive each listing's sort key once, so the comparator does no per-pair lookups or string conversion
+        function sortByColumn(listings, column, direction) {
+            const dir = direction === 'asc' ? 1 : -1;
+            const missing = dir * Infinity;
+            const keyed = listings.map(l => {
+                const value = l[column] == null ? missing : l[column];
+                return { l, value, isNumber: typeof value === 'number', text: String(value).toLowerCase() };
+            });
+            keyed.sort((a, b) => {
+                if (a.isNumber && b.isNumber) return dir * (a.value - b.value);
+                return a.text < b.text ? -dir : a.text > b.text ? dir : 0;
             });
+            return keyed.map(k => k.l);
         }
 
         function handleSort(column) {
@@ -1052,28 +1428,64 @@ def get_html_template() -> str:
             renderTable();
         }
 
-        function setupRowHover() {
-            const preview = document.getElementById('image-preview');
-            document.querySelectorAll('tr[data-url]').forEach(row => {
-                row.addEventListener('mouseenter', (e) => { if (row.dataset.url) { preview.style.display = 'block'; updatePreviewPosition(e); } });
-                row.addEventListener('mousemove', updatePreviewPosition);
-                row.addEventListener('mouseleave', () => { preview.style.display = 'none'; });
-                row.addEventListener('click', (e) => { if (e.target.tagName !== 'A') { const url = row.dataset.url; if (url) window.open(url, '_blank'); } });
-                row.style.cursor = 'pointer';
-            });
+        function handleRowOver(e) {
+            const row = e.target.closest('tr[data-url]');
+            if (row === hoverRow) return;
+            hoverRow = row;
+            document.getElementById('image-preview').style.display = row && row.dataset.url ? 'block' : 'none';
+            if (row) updatePreviewPosition(e);
+        }
+
+        function handleRowMove(e) {
+            if (!hoverRow) return;
+            previewPoint = e;
+            if (previewFramePending) return;
+            previewFramePending = true;
+            requestAnimationFrame(() => { previewFramePending = false; updatePreviewPosition(previewPoint); });
+        }
+
+        function handleRowLeave() {
+            hoverRow = null;
+            document.getElementById('image-preview').style.display = 'none';
+        }
+
+        function handleRowClick(e) {
+            if (e.target.tagName === 'A') return;
+            const row = e.target.closest('tr[data-url]');
+            if (row && row.dataset.url) window.open(row.dataset.url, '_blank');
         }
 
         function updatePreviewPosition(e) {
-            const preview = document.getElementById('image-preview');
-            preview.style.left = Math.min(e.clientX + 20, window.innerWidth - 370) + 'px';
-            preview.style.top = Math.min(e.clientY + 20, window.innerHeight - 300) + 'px';
+            const x = Math.min(e.clientX + 20, window.innerWidth - 370);
+            const y = Math.min(e.clientY + 20, window.innerHeight - 300);
+            document.getElementById('image-preview').style.transform = `translate3d(${x}px, ${y}px, 0)`;
+        }
+
+        function csvQuote(value) {
+            const text = String(value || '');
+            return '"' + (text.includes('"') ? text.replace(/"/g, '""') : text) + '"';
         }
 
         function exportCSV() {
             const headers = ['Rank', 'Year', 'Make', 'Model', 'Stock Number', 'VIN', 'Price', 'Relevance', 'Merch', 'Length', 'Photos', 'Floorplan', 'Views', 'Saves', 'Tier', 'Tier Ceiling', 'Position', 'Days Listed', 'Price Drop Date', 'Dealer', 'City', 'State', 'Region', 'Improvements'];
-            const rows = filteredListings.map(l => [l.rank, l.year, `"${(l.make || '').replace(/"/g, '""')}"`, `"${(l.model || '').replace(/"/g, '""')}"`, `"${(l.stock_number || '').replace(/"/g, '""')}"`, `"${(l.vin || '').replace(/"/g, '""')}"`, l.price || '', l.relevance_score ? Math.round(l.relevance_score) : '', l.merch_score ? Math.round(l.merch_score) : '', l.length || '', l.photo_count || 0, l.has_floorplan ? 'Yes' : 'No', l.views ?? '', l.saves ?? '', l.tier, l.tier_ceiling || '', l.position, l.days_listed ?? '', l.price_drop_date ? new Date(l.price_drop_date).toISOString().split('T')[0] : '', `"${(l.dealer_name || '').replace(/"/g, '""')}"`, `"${(l.city || '').replace(/"/g, '""')}"`, l.state || '', l.region || '', `"${(l.improvements || []).join('; ').replace(/"/g, '""')}"`]);
-            const csv = [headers.join(','), ...rows.map(r => r.join(','))].join('\\n');
-            const blob = new Blob([csv], { type: 'text/csv' });
+            // Encode row by row into one growing UTF-8 buffer instead of joining the whole export as a string
+            const encoder = new TextEncoder();
+            let buffer = new Uint8Array(Math.max(4096, filteredListings.length * 300));
+            let length = 0;
+            const write = text => {
+                const needed = length + text.length * 3;
+                if (needed > buffer.length) {
+                    const grown = new Uint8Array(Math.max(buffer.length * 2, needed));
+                    grown.set(buffer.subarray(0, length));
+                    buffer = grown;
+                }
+                length += encoder.encodeInto(text, buffer.subarray(length)).written;
+            };
+            write(headers.join(','));
+            for (const l of filteredListings) {
+                write('\\n' + [l.rank, l.year, csvQuote(l.make), csvQuote(l.model), csvQuote(l.stock_number), csvQuote(l.vin), l.price || '', l.relevance_score ? Math.round(l.relevance_score) : '', l.merch_score ? Math.round(l.merch_score) : '', l.length || '', l.photo_count || 0, l.has_floorplan ? 'Yes' : 'No', l.views ?? '', l.saves ?? '', l.tier, l.tier_ceiling || '', l.position, l.days_listed ?? '', l.price_drop_day || '', csvQuote(l.dealer_name), csvQuote(l.city), l.state || '', l.region || '', csvQuote((l.improvements || []).join('; '))].join(','));
+            }
+            const blob = new Blob([buffer.subarray(0, length)], { type: 'text/csv' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
@@ -1083,26 +1495,64 @@ def get_html_template() -> str:
         }
 
         function setupEventListeners() {
-            document.getElementById('filter-brand').addEventListener('change', applyFilters);
-            document.getElementById('filter-tier').addEventListener('change', applyFilters);
-            document.getElementById('filter-year').addEventListener('change', applyFilters);
-            document.getElementById('filter-position').addEventListener('change', applyFilters);
-            document.getElementById('filter-zip').addEventListener('change', applyFilters);
-            document.getElementById('filter-type').addEventListener('change', applyFilters);
-            document.getElementById('filter-region').addEventListener('change', applyFilters);
-            document.getElementById('filter-dealer').addEventListener('input', applyFilters);
-            document.getElementById('filter-thor').addEventListener('change', applyFilters);
+            document.getElementById('filter-brand').addEventListener('change', scheduleFilters);
+            document.getElementById('filter-tier').addEventListener('change', scheduleFilters);
+            document.getElementById('filter-year').addEventListener('change', scheduleFilters);
+            document.getElementById('filter-position').addEventListener('change', scheduleFilters);
+            document.getElementById('filter-zip').addEventListener('change', scheduleFilters);
+            document.getElementById('filter-type').addEventListener('change', scheduleFilters);
+            document.getElementById('filter-region').addEventListener('change', scheduleFilters);
+            document.getElementById('filter-dealer').addEventListener('input', () => {
+                clearTimeout(dealerInputTimer);
+                dealerInputTimer = setTimeout(scheduleFilters, DEALER_INPUT_DELAY_MS);
+            });
+            document.getElementById('filter-thor').addEventListener('change', scheduleFilters);
             document.getElementById('btn-reset').addEventListener('click', resetFilters);
             document.getElementById('btn-export').addEventListener('click', exportCSV);
-            document.querySelectorAll('#data-table th[data-sort]').forEach(th => { th.addEventListener('click', () => handleSort(th.dataset.sort)); });
+            sortHeaders.forEach(th => { th.addEventListener('click', () => handleSort(th.dataset.sort)); });
+            document.querySelector('#list-view .table-wrapper').addEventListener('scroll', () => {
+                if (scrollFramePending) return;
+                scrollFramePending = true;
+                requestAnimationFrame(() => { scrollFramePending = false; renderTableWindow(); });
+            }, { passive: true });
+            ['table-body', 'dealer-view'].forEach(id => {
+                const el = document.getElementById(id);
+                el.addEventListener('mouseover', handleRowOver);
+                el.addEventListener('mousemove', handleRowMove);
+                el.addEventListener('mouseleave', handleRowLeave);
+                el.addEventListener('click', handleRowClick);
+            });
         }
 
-        init();
+        if (DATA.packed) unpackData(DATA.packed).then(data => { DATA = data; init(); }).catch(err => showLoadError(err.message));
+        else init();
     </script>
 </body>
 </html>'''
 
 
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+# The stylesheet stays readable above; the shipped copy is minified once at import
+HTML_TEMPLATE = re.sub(r'(<style>)(.*?)(</style>)', lambda m: m[1] + minify_css(m[2]) + m[3], HTML_TEMPLATE, count=1, flags=re.S)
+
+
+def get_html_template() -> str:
+    """Return the standalone dashboard HTML template."""
+    return HTML_TEMPLATE
+
+
+# Encoded halves around the data placeholder, so the payload is streamed between them
+HTML_PREFIX, HTML_SUFFIX = (part.encode('utf-8') for part in HTML_TEMPLATE.split('__EMBEDDED_DATA__', 1))
+
+
 # =============================================================================
 # CLEANUP
 # =============================================================================
@@ -1133,12 +1583,67 @@ def cleanup_old_files(output_dir: Path, keep_data: bool = False):
 # MAIN
 # =============================================================================
 
+def dump_embedded_json(data: Dict) -> bytes:
+    """Serialize dashboard data to compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dictionary_encode(values: list) -> dict:
+    """Encode a column as its distinct values (first-seen order) plus one index per row."""
+    lookup = {}
+    codes = [lookup.setdefault(value, len(lookup)) for value in values]
+    return {'values': list(lookup), 'codes': codes}
+
+
+def listings_to_columns(listings: List[dict]) -> Dict[str, list]:
+    """Transpose listing records into one list per field, so keys are not repeated per row.
+
+    Fields in DICTIONARY_COLUMNS are dictionary-encoded (see dictionary_encode).
+    """
+    if not listings:
+        return {}
+    columns = {}
+    for key in listings[0]:
+        column = [listing[key] for listing in listings]
+        columns[key] = dictionary_encode(column) if key in DICTIONARY_COLUMNS else column
+    return columns
+
+
+def write_dashboard(output_path: Path, data: Dict, compress: bool = False, pack: bool = False) -> int:
+    """Write the standalone dashboard, streaming the payload between the template halves.
+
+    Listings are embedded column-wise (see listings_to_columns). With pack, the
+    JSON is gzipped and embedded as base64 for the page to inflate on load.
+    With compress, a gzip copy is also written next to it as <name>.html.gz
+    for serving. Returns the number of bytes written to the plain HTML file.
+    """
+    payload = {key: value for key, value in data.items() if key != 'listings'}
+    payload['listing_columns'] = listings_to_columns(data.get('listings', []))
+    json_data = dump_embedded_json(payload)
+    if pack:
+        json_data = b'{"packed":"' + base64.b64encode(gzip.compress(json_data, compresslevel=9)) + b'"}'
+    with open(output_path, 'wb') as f:
+        f.write(HTML_PREFIX)
+        f.write(json_data)
+        f.write(HTML_SUFFIX)
+    if compress:
+        with gzip.open(output_path.with_name(output_path.name + '.gz'), 'wb', compresslevel=9) as f:
+            f.write(HTML_PREFIX)
+            f.write(json_data)
+            f.write(HTML_SUFFIX)
+    return len(HTML_PREFIX) + len(json_data) + len(HTML_SUFFIX)
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='Build standalone RV dashboard')
     parser.add_argument('--input', '-i', help='Input ranked_listings JSON file')
     parser.add_argument('--keep-data', action='store_true', help='Keep old data files')
+    parser.add_argument('--gzip', action='store_true', help='Also write a precompressed .html.gz copy')
+    parser.add_argument('--pack-data', action='store_true', help='Embed the data gzipped and base64-encoded')
     args = parser.parse_args()
 
     # Paths
@@ -1157,16 +1662,14 @@ def main():
 
     # Step 2: Generate HTML with embedded data
     print("\n2. Generating standalone HTML...")
-    html_template = get_html_template()
-    json_data = json.dumps(data, ensure_ascii=False)
-    html_content = html_template.replace('__EMBEDDED_DATA__', json_data)
-
     output_path = reports_dir / 'rv_dashboard_standalone.html'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    size = write_dashboard(output_path, data, args.gzip, args.pack_data)
 
     print(f"  Output: {output_path}")
-    print(f"  Size: {len(html_content) / 1024:.1f} KB")
+    print(f"  Size: {size / 1024:.1f} KB")
+    if args.gzip:
+        gz_path = output_path.with_name(output_path.name + '.gz')
+        print(f"  Gzip: {gz_path} ({gz_path.stat().st_size / 1024:.1f} KB)")
 
     # Step 3: Cleanup old files
     print("\n3. Cleaning up old files...")
@@ -19,10 +19,13 @@ Usage:
 """
 
 import csv
+import heapq
+import shutil
 import sys
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from bisect import bisect_left
 import statistics
 import glob
 
@@ -42,6 +45,14 @@ PREMIUM_TIER_A_MIN = 500        # Tier A premium: relevance >= 500
 PREMIUM_TIER_B_MIN = 450        # Tier B premium: 450 <= relevance < 500
 STANDARD_MAX = 400              # Standard: relevance < 400 (gray zone 400-450)
 
+# Columns the audit reads; the rest of the ranked_listings CSV is skipped on load
+LISTING_COLUMNS = (
+    'rank', 'make', 'model', 'year', 'condition', 'price', 'photo_count',
+    'relevance_score', 'merch_score', 'is_premium', 'is_top_premium',
+    'dealer_id', 'dealer_name', 'dealer_group', 'city', 'state',
+)
+TRUE_VALUES = frozenset(('true', '1', 'yes'))
+
 # Thor Industries brands
 THOR_BRANDS = {
     'thor', 'thor motor coach', 'jayco', 'airstream', 'tiffin', 'tiffin motorhomes',
@@ -60,23 +71,43 @@ def find_latest_data_file(output_dir: Path = Path('output')) -> Path:
 
 
 def load_listings(filepath: Path) -> list:
-    """Load listings from CSV file."""
+    """Load listings from CSV file, keeping only LISTING_COLUMNS."""
     listings = []
     with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        index = {name: i for i, name in enumerate(header)}
+        positions = [(name, index[name]) for name in LISTING_COLUMNS if name in index]
+        width = len(header)
+        for values in reader:
+            if not values:
+                continue
+            if len(values) < width:
+                values += [None] * (width - len(values))
+            row = {name: values[i] for name, i in positions}
             row['rank'] = int(row['rank']) if row.get('rank') else None
             row['relevance_score'] = float(row['relevance_score']) if row.get('relevance_score') else 0
             row['merch_score'] = float(row['merch_score']) if row.get('merch_score') else 0
             row['price'] = float(row['price']) if row.get('price') else None
             row['photo_count'] = int(row['photo_count']) if row.get('photo_count') else 0
             row['year'] = int(row['year']) if row.get('year') else None
-            row['is_premium'] = row.get('is_premium', '').lower() in ('true', '1', 'yes')
-            row['is_top_premium'] = row.get('is_top_premium', '').lower() in ('true', '1', 'yes')
+            row['is_premium'] = (row.get('is_premium') or '').lower() in TRUE_VALUES
+            row['is_top_premium'] = (row.get('is_top_premium') or '').lower() in TRUE_VALUES
+            row['spec'] = listing_spec(row)
             listings.append(row)
     return listings
 
 
+def listing_spec(listing: dict) -> tuple:
+    """Normalized (make, model, year, condition) that comparable listings must share."""
+    return (
+        (listing.get('make') or '').lower().strip(),
+        (listing.get('model') or '').lower().strip(),
+        listing.get('year'),
+        (listing.get('condition') or '').lower(),
+    )
+
+
 def is_thor_brand(make: str) -> bool:
     """Check if make is a Thor Industries brand."""
     if not make:
@@ -84,6 +115,15 @@ def is_thor_brand(make: str) -> bool:
     return make.lower().strip() in THOR_BRANDS
 
 
+def prices_comparable(price_a, price_b) -> bool:
+    """Check two prices are within PRICE_TOLERANCE_PCT (missing prices always match)."""
+    if price_a and price_b:
+        avg_price = (price_a + price_b) / 2
+        if abs(price_a - price_b) / avg_price > PRICE_TOLERANCE_PCT:
+            return False
+    return True
+
+
 def are_comparable(listing_a: dict, listing_b: dict) -> bool:
     """
     Determine if two listings are comparable (same specs, different dealers).
@@ -99,32 +139,16 @@ def are_comparable(listing_a: dict, listing_b: dict) -> bool:
     if listing_a.get('dealer_id') == listing_b.get('dealer_id'):
         return False
 
-    # Must have same make/model (case-insensitive)
-    make_a = (listing_a.get('make') or '').lower().strip()
-    make_b = (listing_b.get('make') or '').lower().strip()
-    model_a = (listing_a.get('model') or '').lower().strip()
-    model_b = (listing_b.get('model') or '').lower().strip()
-
-    if make_a != make_b or model_a != model_b:
-        return False
-
-    # Must have same year
-    if listing_a.get('year') != listing_b.get('year'):
-        return False
-
-    # Must have same condition
-    cond_a = (listing_a.get('condition') or '').lower()
-    cond_b = (listing_b.get('condition') or '').lower()
-    if cond_a != cond_b:
+    # Must have same make/model (case-insensitive), year and condition;
+    # load_listings normalizes these once per listing as 'spec'
+    spec_a = listing_a.get('spec') or listing_spec(listing_a)
+    spec_b = listing_b.get('spec') or listing_spec(listing_b)
+    if spec_a != spec_b:
         return False
 
     # Price within tolerance (if both have prices)
-    price_a = listing_a.get('price')
-    price_b = listing_b.get('price')
-    if price_a and price_b:
-        avg_price = (price_a + price_b) / 2
-        if abs(price_a - price_b) / avg_price > PRICE_TOLERANCE_PCT:
-            return False
+    if not prices_comparable(listing_a.get('price'), listing_b.get('price')):
+        return False
 
     # Photo count within tolerance
     photos_a = listing_a.get('photo_count', 0)
@@ -143,12 +167,7 @@ def find_comparable_pairs(listings: list) -> list:
     # Group by make+model+year+condition for efficiency
     groups = defaultdict(list)
     for listing in listings:
-        key = (
-            (listing.get('make') or '').lower().strip(),
-            (listing.get('model') or '').lower().strip(),
-            listing.get('year'),
-            (listing.get('condition') or '').lower(),
-        )
+        key = listing.get('spec') or listing_spec(listing)
         if key[0] and key[1]:  # Must have make and model
             groups[key].append(listing)
 
@@ -157,19 +176,37 @@ def find_comparable_pairs(listings: list) -> list:
         if len(group_listings) < 2:
             continue
 
-        # Compare all pairs within group
-        for i, listing_a in enumerate(group_listings):
-            for listing_b in group_listings[i+1:]:
-                if are_comparable(listing_a, listing_b):
-                    rel_a = listing_a.get('relevance_score', 0)
-                    rel_b = listing_b.get('relevance_score', 0)
-                    gap = abs(rel_a - rel_b)
-
-                    # Order so higher relevance is first
-                    if rel_a >= rel_b:
-                        pairs.append((listing_a, listing_b, gap))
-                    else:
-                        pairs.append((listing_b, listing_a, gap))
+        # Photo counts must be within PHOTO_TOLERANCE, so after sorting by photos each listing
+        # only needs comparing against the neighbours inside that window. The group key already
+        # guarantees matching specs, leaving only the dealer and price checks of are_comparable.
+        photos = [listing.get('photo_count', 0) for listing in group_listings]
+        dealers = [listing.get('dealer_id') for listing in group_listings]
+        prices = [listing.get('price') for listing in group_listings]
+        by_photos = sorted(range(len(group_listings)), key=photos.__getitem__)
+        count = len(by_photos)
+        matches = []
+        for pos, i in enumerate(by_photos):
+            for nxt in range(pos + 1, count):
+                j = by_photos[nxt]
+                if photos[j] - photos[i] > PHOTO_TOLERANCE:
+                    break
+                if dealers[i] != dealers[j] and prices_comparable(prices[i], prices[j]):
+                    matches.append((i, j) if i < j else (j, i))
+
+        # Emit pairs in the same order as a full scan of the group would
+        matches.sort()
+        for a, b in matches:
+            listing_a = group_listings[a]
+            listing_b = group_listings[b]
+            rel_a = listing_a.get('relevance_score', 0)
+            rel_b = listing_b.get('relevance_score', 0)
+            gap = abs(rel_a - rel_b)
+
+            # Order so higher relevance is first
+            if rel_a >= rel_b:
+                pairs.append((listing_a, listing_b, gap))
+            else:
+                pairs.append((listing_b, listing_a, gap))
 
     return pairs
 
@@ -185,108 +222,116 @@ def analyze_dealer_tiers(listings: list, pairs: list) -> list:
        - Standard: most listings have relevance < 400
     2. SECONDARY: Use head-to-head comparisons to validate/refine
     """
-    # Track dealer stats
-    dealer_stats = defaultdict(lambda: {
-        'dealer_id': None,
-        'dealer_name': '',
-        'dealer_group': '',
-        'city': '',
-        'state': '',
-        'total_listings': 0,
-        'thor_listings': 0,
-        'wins': 0,
-        'losses': 0,
-        'win_gaps': [],
-        'loss_gaps': [],
-        'opponents': set(),
-        'relevance_scores': [],
-        'tier_a_listings': 0,  # Listings with relevance >= 500
-        'tier_b_listings': 0,  # Listings with relevance 450-499
-        'standard_listings': 0,  # Listings with relevance < 400
-    })
-
-    # First pass: collect dealer info and classify each listing
+    # Track dealer stats column-wise: each dealer gets a dense index (in
+    # first-seen order) into one list per stat
+    dealer_ix = {}
+    dealer_info = []  # (dealer_name, dealer_group, city, state)
+    total_listings = []
+    thor_listings = []
+    relevance_scores = []
+    win_gaps = []
+    loss_gaps = []
+
+    def add_dealer(dealer_id) -> int:
+        dealer_ix[dealer_id] = len(dealer_info)
+        dealer_info.append(('', '', '', ''))
+        total_listings.append(0)
+        thor_listings.append(0)
+        relevance_scores.append([])
+        win_gaps.append([])
+        loss_gaps.append([])
+        return dealer_ix[dealer_id]
+
+    # First pass: collect dealer info and relevance scores (tier counts are
+    # taken from the sorted scores once per dealer below)
     for listing in listings:
         dealer_id = listing.get('dealer_id')
         if not dealer_id:
             continue
 
-        d = dealer_stats[dealer_id]
-        d['dealer_id'] = dealer_id
-        d['dealer_name'] = listing.get('dealer_name', '')
-        d['dealer_group'] = listing.get('dealer_group', '')
-        d['city'] = listing.get('city', '')
-        d['state'] = listing.get('state', '')
-        d['total_listings'] += 1
-
-        rel_score = listing.get('relevance_score', 0)
-        d['relevance_scores'].append(rel_score)
-
-        # Classify this listing
-        if rel_score >= PREMIUM_TIER_A_MIN:
-            d['tier_a_listings'] += 1
-        elif rel_score >= PREMIUM_TIER_B_MIN:
-            d['tier_b_listings'] += 1
-        elif rel_score < STANDARD_MAX:
-            d['standard_listings'] += 1
-        # else: gray zone 400-450, don't count either way
+        i = dealer_ix.get(dealer_id)
+        if i is None:
+            i = add_dealer(dealer_id)
+        dealer_info[i] = (
+            listing.get('dealer_name', ''),
+            listing.get('dealer_group', ''),
+            listing.get('city', ''),
+            listing.get('state', ''),
+        )
+        total_listings[i] += 1
+        relevance_scores[i].append(listing.get('relevance_score', 0))
 
         if is_thor_brand(listing.get('make', '')):
-            d['thor_listings'] += 1
-
-    # Second pass: analyze pairwise comparisons
-    for winner, loser, gap in pairs:
-        if gap < MIN_RELEVANCE_GAP:
-            continue
-
-        winner_id = winner.get('dealer_id')
-        loser_id = loser.get('dealer_id')
-
+            thor_listings[i] += 1
+
+    # Second pass: analyze pairwise comparisons. Only the gaps are
+    # accumulated per dealer; wins/losses are the lengths of those lists.
+    significant = [
+        (winner.get('dealer_id'), loser.get('dealer_id'), gap)
+        for winner, loser, gap in pairs
+        if gap >= MIN_RELEVANCE_GAP
+    ]
+    for winner_id, loser_id, gap in significant:
         if winner_id:
-            dealer_stats[winner_id]['wins'] += 1
-            dealer_stats[winner_id]['win_gaps'].append(gap)
-            dealer_stats[winner_id]['opponents'].add(loser_id)
+            i = dealer_ix.get(winner_id)
+            if i is None:
+                i = add_dealer(winner_id)
+            win_gaps[i].append(gap)
 
         if loser_id:
-            dealer_stats[loser_id]['losses'] += 1
-            dealer_stats[loser_id]['loss_gaps'].append(gap)
-            dealer_stats[loser_id]['opponents'].add(winner_id)
+            i = dealer_ix.get(loser_id)
+            if i is None:
+                i = add_dealer(loser_id)
+            loss_gaps[i].append(gap)
+
+    # Distinct opponents, from every (dealer, opponent) matchup seen on either side
+    matchups = {(winner_id, loser_id) for winner_id, loser_id, _ in significant if winner_id}
+    matchups.update((loser_id, winner_id) for winner_id, loser_id, _ in significant if loser_id)
+    opponent_counts = Counter(dealer_id for dealer_id, _ in matchups)
 
     # Calculate tier classification for each dealer
     results = []
-    for dealer_id, stats in dealer_stats.items():
-        wins = stats['wins']
-        losses = stats['losses']
-        total_comparisons = wins + losses
-        total_listings = stats['total_listings']
+    for dealer_id, i in dealer_ix.items():
+        dealer_wins = len(win_gaps[i])
+        dealer_losses = len(loss_gaps[i])
+        total_comparisons = dealer_wins + dealer_losses
+        listing_count = total_listings[i]
+
+        scores = sorted(relevance_scores[i])
+        avg_relevance = statistics.fmean(scores) if scores else 0
+        max_relevance = max(scores) if scores else 0
+        median_relevance = statistics.median(scores) if scores else 0
 
-        avg_relevance = statistics.mean(stats['relevance_scores']) if stats['relevance_scores'] else 0
-        max_relevance = max(stats['relevance_scores']) if stats['relevance_scores'] else 0
-        median_relevance = statistics.median(stats['relevance_scores']) if stats['relevance_scores'] else 0
+        # Classify listings by bisecting the sorted scores at each cutoff
+        # (gray zone 400-450 is not counted either way)
+        below_tier_a = bisect_left(scores, PREMIUM_TIER_A_MIN)
+        tier_a_listings = len(scores) - below_tier_a  # relevance >= 500
+        tier_b_listings = below_tier_a - bisect_left(scores, PREMIUM_TIER_B_MIN)  # 450-499
+        standard_listings = bisect_left(scores, STANDARD_MAX)  # relevance < 400
 
-        avg_win_gap = statistics.mean(stats['win_gaps']) if stats['win_gaps'] else 0
-        avg_loss_gap = statistics.mean(stats['loss_gaps']) if stats['loss_gaps'] else 0
+        avg_win_gap = statistics.fmean(win_gaps[i]) if win_gaps[i] else 0
+        avg_loss_gap = statistics.fmean(loss_gaps[i]) if loss_gaps[i] else 0
 
-        win_rate = wins / total_comparisons if total_comparisons > 0 else None
+        win_rate = dealer_wins / total_comparisons if total_comparisons > 0 else None
 
-        tier_a_pct = stats['tier_a_listings'] / total_listings if total_listings > 0 else 0
-        tier_b_pct = stats['tier_b_listings'] / total_listings if total_listings > 0 else 0
-        standard_pct = stats['standard_listings'] / total_listings if total_listings > 0 else 0
+        tier_a_pct = tier_a_listings / listing_count if listing_count > 0 else 0
+        tier_b_pct = tier_b_listings / listing_count if listing_count > 0 else 0
+        standard_pct = standard_listings / listing_count if listing_count > 0 else 0
 
         # PRIMARY CLASSIFICATION: Based on relevance score distribution
         # A dealer is classified by their BEST listings (the premium they're paying for)
-        if stats['tier_a_listings'] >= 3 or tier_a_pct >= 0.10:
+        if tier_a_listings >= 3 or tier_a_pct >= 0.10:
             # Has meaningful Tier A premium listings
             inferred_tier = 'premium_A'
-            confidence = 'high' if stats['tier_a_listings'] >= 5 else 'medium'
-        elif stats['tier_b_listings'] >= 3 or tier_b_pct >= 0.10:
+            confidence = 'high' if tier_a_listings >= 5 else 'medium'
+        elif tier_b_listings >= 3 or tier_b_pct >= 0.10:
             # Has meaningful Tier B premium listings
             inferred_tier = 'premium_B'
-            confidence = 'high' if stats['tier_b_listings'] >= 5 else 'medium'
-        elif standard_pct >= 0.50 and stats['tier_a_listings'] == 0 and stats['tier_b_listings'] == 0:
+            confidence = 'high' if tier_b_listings >= 5 else 'medium'
+        elif standard_pct >= 0.50 and tier_a_listings == 0 and tier_b_listings == 0:
             # Majority standard, no premium listings
             inferred_tier = 'standard'
-            confidence = 'high' if stats['standard_listings'] >= 10 else 'medium'
+            confidence = 'high' if standard_listings >= 10 else 'medium'
         elif avg_relevance < STANDARD_MAX:
             # Low average relevance suggests standard
             inferred_tier = 'likely_standard'
@@ -315,32 +360,33 @@ def analyze_dealer_tiers(listings: list, pairs: list) -> list:
             elif win_rate <= 0.20 and avg_loss_gap >= 100:
                 # Consistently loses by large margin on compared listings
                 # BUT only downgrade if they have NO premium listings
-                if stats['tier_a_listings'] == 0 and stats['tier_b_listings'] == 0:
+                if tier_a_listings == 0 and tier_b_listings == 0:
                     if inferred_tier.startswith('premium') or inferred_tier.startswith('likely_premium'):
                         inferred_tier = 'standard'
                     confidence = 'high'
                 # If they have premium listings, mark as mixed (has both)
-                elif stats['tier_a_listings'] > 0 or stats['tier_b_listings'] > 0:
+                elif tier_a_listings > 0 or tier_b_listings > 0:
                     inferred_tier = inferred_tier + '_mixed' if not inferred_tier.endswith('_mixed') else inferred_tier
 
+        dealer_name, dealer_group, city, state = dealer_info[i]
         results.append({
             'dealer_id': dealer_id,
-            'dealer_name': stats['dealer_name'],
-            'dealer_group': stats['dealer_group'],
-            'city': stats['city'],
-            'state': stats['state'],
-            'total_listings': total_listings,
-            'thor_listings': stats['thor_listings'],
-            'tier_a_listings': stats['tier_a_listings'],
-            'tier_b_listings': stats['tier_b_listings'],
-            'standard_listings': stats['standard_listings'],
+            'dealer_name': dealer_name,
+            'dealer_group': dealer_group,
+            'city': city,
+            'state': state,
+            'total_listings': listing_count,
+            'thor_listings': thor_listings[i],
+            'tier_a_listings': tier_a_listings,
+            'tier_b_listings': tier_b_listings,
+            'standard_listings': standard_listings,
             'comparisons': total_comparisons,
-            'wins': wins,
-            'losses': losses,
+            'wins': dealer_wins,
+            'losses': dealer_losses,
             'win_rate': round(win_rate, 2) if win_rate is not None else None,
             'avg_win_gap': round(avg_win_gap, 1),
             'avg_loss_gap': round(avg_loss_gap, 1),
-            'opponents_count': len(stats['opponents']),
+            'opponents_count': opponent_counts[dealer_id],
             'avg_relevance': round(avg_relevance, 1),
             'max_relevance': round(max_relevance, 1),
             'median_relevance': round(median_relevance, 1),
@@ -380,18 +426,20 @@ def save_results(results: list, pairs: list, output_dir: Path):
         'inferred_tier', 'confidence', 'last_updated'
     ]
 
-    for filepath in [main_file, backup_file]:
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
+    # Serialize once, then copy the finished file as the timestamped backup
+    with open(main_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(results)
+    shutil.copyfile(main_file, backup_file)
 
     print(f"\nSaved: {main_file}")
     print(f"Backup: {backup_file}")
 
-    # Save significant pairs for evidence
-    significant_pairs = [(w, l, g) for w, l, g in pairs if g >= MIN_RELEVANCE_GAP]
-    if significant_pairs:
+    # Save the top 100 significant pairs for evidence
+    significant_pairs = (pair for pair in pairs if pair[2] >= MIN_RELEVANCE_GAP)
+    top_pairs = heapq.nlargest(100, significant_pairs, key=lambda x: x[2])
+    if top_pairs:
         pairs_fields = [
             'make', 'model', 'year', 'condition', 'price_a', 'price_b',
             'photos_a', 'photos_b',
@@ -402,7 +450,7 @@ def save_results(results: list, pairs: list, output_dir: Path):
         with open(pairs_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=pairs_fields)
             writer.writeheader()
-            for winner, loser, gap in sorted(significant_pairs, key=lambda x: -x[2])[:100]:
+            for winner, loser, gap in top_pairs:
                 writer.writerow({
                     'make': winner.get('make', ''),
                     'model': winner.get('model', ''),
@@ -0,0 +1,27 @@
+"""Tests for src/complete/build_dashboard.py."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src' / 'complete'))
+
+from build_dashboard import calculate_days_listed, parse_create_date
+
+
+def test_parse_create_date_accepted_formats():
+    assert parse_create_date('2026-01-01T10:00:00Z') == datetime(2026, 1, 1, 10, 0, 0)
+    assert parse_create_date('2026-01-01T10:00:00') == datetime(2026, 1, 1, 10, 0, 0)
+    assert parse_create_date('2026-01-01') == datetime(2026, 1, 1)
+
+
+def test_parse_create_date_rejects_short_z_and_space_separated():
+    assert parse_create_date('2026-01-01T10:00Z') is None
+    assert parse_create_date('2026-01-01 10:00') is None
+    assert parse_create_date('2026-01-01 10:00:00') is None
+
+
+def test_calculate_days_listed_short_z_does_not_raise():
+    now = datetime(2026, 1, 11, 10, 0, 0)
+    assert calculate_days_listed('2026-01-01T10:00Z', now) is None
+    assert calculate_days_listed('2026-01-01T10:00:00Z', now) == 10
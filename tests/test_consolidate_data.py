@@ -0,0 +1,27 @@
+"""Tests for src/complete/archive/consolidate_data.py."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src' / 'complete' / 'archive'))
+
+from consolidate_data import identify_thor_brand
+
+
+def test_identify_thor_brand_matches_brand_inside_make():
+    assert identify_thor_brand('Coleman By Dutchmen') == 'Dutchmen RV'
+    assert identify_thor_brand('Voltage By Dutchmen') == 'Dutchmen RV'
+    assert identify_thor_brand('Emblem (By Entegra Coach)') == 'Entegra Coach'
+    assert identify_thor_brand('Hideout By Keystone') == 'Keystone RV'
+    assert identify_thor_brand('Resonate (By Thor)') == 'Thor Motor Coach'
+
+
+def test_identify_thor_brand_uses_leftmost_brand():
+    assert identify_thor_brand('Keystone/Dutchmen') == 'Keystone RV'
+    assert identify_thor_brand('Jayco|Thor') == 'Jayco'
+
+
+def test_identify_thor_brand_non_thor():
+    assert identify_thor_brand('Forest River') is None
+    assert identify_thor_brand('') is None
+    assert identify_thor_brand(None) is None